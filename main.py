@@ -62,6 +62,7 @@ def main():
     parser.add_argument('--threshold', type=float, default=0.7, help='分类置信度阈值')
     parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     parser.add_argument('--no-ml', action='store_true', help='禁用机器学习功能')
+    parser.add_argument('--processes', action='store_true', help='使用多进程并行分类（CPU 密集场景）')
     
     args = parser.parse_args()
     
@@ -121,18 +122,18 @@ def main():
             
             logger.info(f"将处理 {len(input_files)} 个文件: {input_files}")
             
-            processor = BookmarkProcessor(
+            with BookmarkProcessor(
                 config_path=args.config,
                 max_workers=args.workers,
                 use_ml=not args.no_ml,
                 confidence_threshold=args.threshold,
-            )
-            
-            results = processor.process_files(
-                input_files=input_files,
-                output_dir=args.output,
-                train_models=args.train
-            )
+                use_processes=args.processes,
+            ) as processor:
+                results = processor.process_files(
+                    input_files=input_files,
+                    output_dir=args.output,
+                    train_models=args.train
+                )
             
             logger.info(f"处理完成: {results['processed_bookmarks']} 个书签已分类")
         else:
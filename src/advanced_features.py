@@ -13,14 +13,15 @@ Advanced Features Module
 
 import os
 import sys
-import json
 import hashlib
+import heapq
 import requests
 import sqlite3
 from typing import Dict, List, Tuple, Optional, Set, Any
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 from collections import defaultdict, Counter
+from operator import itemgetter
 import logging
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -29,9 +30,27 @@ import re
 from dataclasses import dataclass, field
 import pickle
 
+import numpy as np
+
 # 导入其他模块
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from .json_io import load_json, dump_json
+
+# 去重时优先保留的知名域名（精确匹配或其子域名）
+TRUSTED_DOMAINS = frozenset({'github.com', 'stackoverflow.com', 'wikipedia.org'})
+
+def _is_trusted_domain(domain: str) -> bool:
+    """判断域名是否属于知名域名或其子域名"""
+    if domain in TRUSTED_DOMAINS:
+        return True
+    # 逐级剥离子域名后做集合查找，开销与域名层级数成正比
+    while '.' in domain:
+        domain = domain.split('.', 1)[1]
+        if domain in TRUSTED_DOMAINS:
+            return True
+    return False
+
 @dataclass
 class BookmarkHealth:
     """书签健康状态"""
@@ -276,46 +295,47 @@ class IntelligentDeduplicator:
         
         return 1.0 - (edit_distance / max_len)
     
-    def suggest_best_bookmark(self, duplicate_group: List[Dict]) -> Dict:
-        """从重复组中选择最佳书签"""
+    def _score_bookmarks(self, bookmarks: List[Dict]) -> np.ndarray:
+        """批量计算书签质量评分（列式向量化）"""
+        urls = [bookmark.get('url', '') for bookmark in bookmarks]
+        titles = [bookmark.get('title', '') for bookmark in bookmarks]
+        
+        is_https = np.fromiter((url.startswith('https://') for url in urls), dtype=bool, count=len(urls))
+        url_len = np.fromiter((len(url) for url in urls), dtype=np.int64, count=len(urls))
+        title_len = np.fromiter((len(title) for title in titles), dtype=np.int64, count=len(titles))
+        has_query = np.fromiter(('?' in url for url in urls), dtype=bool, count=len(urls))
+        trusted_domain = np.fromiter(
+            (_is_trusted_domain(urlparse(url).hostname or '') for url in urls),
+            dtype=bool, count=len(urls)
+        )
+        
+        # HTTPS +2，短URL +1（通常是canonical URL），标题长度适中 +1，无跟踪参数 +1，知名域名 +2
+        return (
+            2 * is_https
+            + (url_len < 100)
+            + ((title_len >= 10) & (title_len <= 100))
+            + ~has_query
+            + 2 * trusted_domain
+        ).astype(np.int64)
+    
+    def suggest_best_bookmark(self, duplicate_group: List[Dict], scores: Optional[np.ndarray] = None) -> Dict:
+        """从重复组中选择最佳书签
+        
+        Args:
+            duplicate_group: 重复书签组
+            scores: 预先计算好的组内评分（可选，与组内顺序一致）
+        """
         if not duplicate_group:
             return None
         
         if len(duplicate_group) == 1:
             return duplicate_group[0]
         
-        # 评分标准
-        def score_bookmark(bookmark):
-            score = 0
-            url = bookmark.get('url', '')
-            title = bookmark.get('title', '')
-            
-            # HTTPS加分
-            if url.startswith('https://'):
-                score += 2
-            
-            # 更短的URL加分（通常是canonical URL）
-            if len(url) < 100:
-                score += 1
-            
-            # 标题长度适中加分
-            if 10 <= len(title) <= 100:
-                score += 1
-            
-            # 没有跟踪参数加分
-            if '?' not in url:
-                score += 1
-            
-            # 知名域名加分
-            domain = urlparse(url).netloc.lower()
-            if any(trusted in domain for trusted in ['github.com', 'stackoverflow.com', 'wikipedia.org']):
-                score += 2
-            
-            return score
+        if scores is None:
+            scores = self._score_bookmarks(duplicate_group)
         
-        # 选择评分最高的书签
-        best_bookmark = max(duplicate_group, key=score_bookmark)
-        return best_bookmark
+        # 选择评分最高的书签（并列时保留靠前者）
+        return duplicate_group[int(scores.argmax())]
     
     def remove_duplicates(self, bookmarks: List[Dict], interactive=False) -> Tuple[List[Dict], List[Dict]]:
         """移除重复书签"""
@@ -327,11 +347,16 @@ class IntelligentDeduplicator:
         removed_bookmarks = []
         unique_bookmarks = bookmarks.copy()
         
+        # 一次性为全部书签计算评分，组内仅做索引查找
+        all_scores = self._score_bookmarks(bookmarks)
+        index_of = {id(bookmark): i for i, bookmark in enumerate(bookmarks)}
+        
         for group in duplicate_groups:
+            group_scores = all_scores[[index_of[id(bookmark)] for bookmark in group]]
             if interactive:
-                best_bookmark = self._interactive_selection(group)
+                best_bookmark = self._interactive_selection(group, group_scores)
             else:
-                best_bookmark = self.suggest_best_bookmark(group)
+                best_bookmark = self.suggest_best_bookmark(group, group_scores)
             
             # 移除组中的其他书签
             for bookmark in group:
@@ -342,14 +367,14 @@ class IntelligentDeduplicator:
         self.logger.info(f"移除了 {len(removed_bookmarks)} 个重复书签")
         return unique_bookmarks, removed_bookmarks
     
-    def _interactive_selection(self, group: List[Dict]) -> Dict:
+    def _interactive_selection(self, group: List[Dict], scores: Optional[np.ndarray] = None) -> Dict:
         """交互式选择最佳书签"""
         print(f"\n发现 {len(group)} 个相似书签:")
         for i, bookmark in enumerate(group):
             print(f"{i+1}. {bookmark.get('title', 'No title')}")
             print(f"   URL: {bookmark.get('url', 'No URL')}")
         
-        suggested = self.suggest_best_bookmark(group)
+        suggested = self.suggest_best_bookmark(group, scores)
         suggested_index = group.index(suggested) + 1
         
         while True:
@@ -378,6 +403,12 @@ class PersonalizedRecommendationSystem:
         self.time_patterns = defaultdict(list)
         self.logger = logging.getLogger(__name__)
         
+        # 推荐热路径使用的列式偏好数组（学习/加载后重建）
+        self._rec_categories: List[str] = []
+        self._rec_preferences = np.zeros(0)
+        self._rec_in_preferences = np.zeros(0, dtype=bool)
+        self._rec_avg_hours = np.zeros(0)
+        
         # 加载历史数据
         self._load_model()
     
@@ -400,37 +431,38 @@ class PersonalizedRecommendationSystem:
         
         # 归一化偏好分数
         self._normalize_preferences()
+        self._rebuild_preference_arrays()
         
         # 保存模型
         self._save_model()
     
     def recommend_categories(self, url: str, title: str, n_recommendations: int = 3) -> List[Tuple[str, float]]:
         """推荐书签分类"""
+        if not self._rec_categories or n_recommendations <= 0:
+            return []
+        
         domain = self._extract_domain(url)
         current_hour = datetime.now().hour
         
-        scores = defaultdict(float)
+        # 基于分类偏好
+        scores = self._rec_preferences * 0.5
         
-        # 基于域名偏好
+        # 基于域名偏好（简化的关联计算：仅作用于已有偏好的分类）
         if domain in self.domain_preferences:
-            for category in self.category_preferences:
-                # 简化的关联计算
-                scores[category] += self.domain_preferences[domain] * 0.3
+            scores = scores + self._rec_in_preferences * (self.domain_preferences[domain] * 0.3)
         
-        # 基于时间模式
-        for category, hours in self.time_patterns.items():
-            if hours:
-                avg_hour = sum(hours) / len(hours)
-                time_similarity = 1 - abs(current_hour - avg_hour) / 12
-                scores[category] += time_similarity * self.category_preferences[category] * 0.2
-        
-        # 基于分类偏好
-        for category, preference in self.category_preferences.items():
-            scores[category] += preference * 0.5
+        # 基于时间模式（无时间记录的分类贡献为0）
+        has_hours = ~np.isnan(self._rec_avg_hours)
+        time_similarity = np.where(has_hours, 1 - np.abs(current_hour - self._rec_avg_hours) / 12, 0.0)
+        scores = scores + time_similarity * self._rec_preferences * 0.2
         
         # 排序并返回推荐
-        recommendations = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return recommendations[:n_recommendations]
+        if n_recommendations < len(scores):
+            top_idx = np.argpartition(-scores, n_recommendations - 1)[:n_recommendations]
+        else:
+            top_idx = np.arange(len(scores))
+        top_idx = top_idx[np.lexsort((top_idx, -scores[top_idx]))]
+        return [(self._rec_categories[i], float(scores[i])) for i in top_idx]
     
     def recommend_similar_bookmarks(self, target_bookmark: Dict, all_bookmarks: List[Dict], n_recommendations: int = 5) -> List[Dict]:
         """推荐相似书签"""
@@ -463,13 +495,14 @@ class PersonalizedRecommendationSystem:
                 scored_bookmarks.append((bookmark, score))
         
         # 排序并返回推荐
-        scored_bookmarks.sort(key=lambda x: x[1], reverse=True)
-        return [bookmark for bookmark, score in scored_bookmarks[:n_recommendations]]
+        # 只取前 n 个，heapq.nlargest 为 O(N log n)，结果与完整排序后切片一致
+        top = heapq.nlargest(n_recommendations, scored_bookmarks, key=itemgetter(1))
+        return [bookmark for bookmark, score in top]
     
     def get_trending_categories(self, days: int = 7) -> List[Tuple[str, int]]:
         """获取趋势分类"""
         # 这里简化处理，实际应该基于时间序列数据
-        return sorted(self.category_preferences.items(), key=lambda x: x[1], reverse=True)[:10]
+        return heapq.nlargest(10, self.category_preferences.items(), key=itemgetter(1))
     
     def _extract_domain(self, url: str) -> str:
         """提取域名"""
@@ -492,6 +525,22 @@ class PersonalizedRecommendationSystem:
             for domain in self.domain_preferences:
                 self.domain_preferences[domain] /= total
     
+    def _rebuild_preference_arrays(self):
+        """将偏好字典物化为列式数组，供 recommend_categories 使用"""
+        categories = list(self.category_preferences)
+        categories.extend(c for c, hours in self.time_patterns.items() if hours and c not in self.category_preferences)
+        
+        self._rec_categories = categories
+        self._rec_preferences = np.array(
+            [self.category_preferences.get(c, 0.0) for c in categories], dtype=np.float64
+        )
+        self._rec_in_preferences = np.array([c in self.category_preferences for c in categories], dtype=bool)
+        self._rec_avg_hours = np.array(
+            [sum(hours) / len(hours) if hours else np.nan
+             for hours in (self.time_patterns.get(c) for c in categories)],
+            dtype=np.float64
+        )
+    
     def _save_model(self):
         """保存推荐模型"""
         model_data = {
@@ -515,6 +564,7 @@ class PersonalizedRecommendationSystem:
                 self.category_preferences = defaultdict(float, model_data.get('category_preferences', {}))
                 self.domain_preferences = defaultdict(float, model_data.get('domain_preferences', {}))
                 self.time_patterns = defaultdict(list, model_data.get('time_patterns', {}))
+                self._rebuild_preference_arrays()
                 
                 self.logger.info("推荐模型加载成功")
             except Exception as e:
@@ -709,8 +759,7 @@ class BatchImportExport:
     def import_from_json(self, json_file: str) -> List[Dict]:
         """从JSON文件导入书签"""
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(json_file)
             
             if isinstance(data, list):
                 bookmarks = data
@@ -740,8 +789,7 @@ class BatchImportExport:
                 'bookmarks': bookmarks
             }
             
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            dump_json(export_data, json_file)
             
             self.logger.info(f"成功导出 {len(bookmarks)} 个书签到JSON")
             return True
@@ -10,16 +10,22 @@ AI书签分类器核心模块
 """
 
 import os
-import json
+import sys
 import logging
+import threading
+import time
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
-from collections import defaultdict
-import hashlib
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import re
 from urllib.parse import urlparse
 
+import numpy as np
+
 # 导入子模块
 try:
     from .ml_classifier import MLClassifierWrapper
@@ -33,14 +39,103 @@ except ImportError:
     LLMClassifier = None
 
 from .rule_engine import RuleEngine
+from .json_io import load_json, dump_json
 
 # 导入占位符模块
 from .placeholder_modules import (
     SemanticAnalyzer, UserProfiler, PerformanceMonitor
 )
 
+# 预编译的语言检测正则
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+_LATIN_RE = re.compile(r'[a-zA-Z]')
+
+# 融合时各分类方法的权重（未列出的方法使用默认权重）
+METHOD_WEIGHTS: Dict[str, float] = {
+    'rule_engine': 0.35,
+    'machine_learning': 0.25,
+    'semantic_analyzer': 0.15,
+    'user_profiler': 0.10,
+    'llm': 0.50,
+}
+DEFAULT_METHOD_WEIGHT = 0.1
+
+# 内容类型判定表：(内容类型, 是否匹配标题, 子串)，按顺序取第一个命中项
+_CONTENT_TYPE_RULES: Tuple[Tuple[str, bool, Tuple[str, ...]], ...] = (
+    ('video', False, ('youtube.com', 'bilibili.com', 'vimeo.com')),
+    ('code_repository', False, ('github.com', 'gitlab.com')),
+    ('documentation', False, ('docs.', 'documentation', 'wiki')),
+    ('academic_paper', False, ('arxiv.org', 'acm.org', 'ieee.org')),
+    ('news', True, ('news', '新闻', 'breaking')),
+    ('online_tool', True, ('tool', '工具', 'online', 'generator')),
+)
+
+
+@lru_cache(maxsize=8192)
+def _parse_url(url: str) -> Tuple[str, Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """解析URL为 (domain, path_segments, query_params)，结果按URL缓存"""
+    parsed = urlparse(url)
+    domain = parsed.netloc.lower().replace('www.', '')
+    path_segments = tuple(seg for seg in parsed.path.split('/') if seg)
 
-@dataclass
+    # 解析查询参数
+    query_params: Tuple[Tuple[str, str], ...] = ()
+    if parsed.query:
+        query_params = tuple(
+            tuple(param.split('=', 1)) for param in parsed.query.split('&') if '=' in param
+        )
+    return domain, path_segments, query_params
+
+
+def _detect_content_type(url_lower: str, title_lower: str) -> str:
+    """按 _CONTENT_TYPE_RULES 判定内容类型（参数为已小写的 URL 与标题）"""
+    for content_type, match_title, needles in _CONTENT_TYPE_RULES:
+        text = title_lower if match_title else url_lower
+        for needle in needles:
+            if needle in text:
+                return content_type
+    return 'webpage'
+
+
+def _detect_language(title: str) -> str:
+    # 纯 ASCII 标题不可能包含中文，跳过中文正则
+    if not title.isascii() and _CJK_RE.search(title):
+        return 'zh'
+    elif _LATIN_RE.search(title):
+        return 'en'
+    else:
+        return 'unknown'
+
+
+def _strip_category_prefix(text: str) -> str:
+    if not text:
+        return ""
+    s = str(text).strip()
+    i = 0
+    while i < len(s) and not ("\u4e00" <= s[i] <= "\u9fff" or s[i].isalnum()):
+        i += 1
+    return s[i:].strip() if i < len(s) else s
+
+
+@lru_cache(maxsize=4096)
+def _normalize_category(category: str) -> str:
+    """规范化分类名（去除 emoji 等前缀），结果经 sys.intern 驻留
+
+    分类集合小且固定，缓存后各子分类器结果、融合得分字典与分类缓存共享同一字符串对象，
+    字典查找可走指针相等的快速路径。
+    """
+    cat = category.strip()
+    if not cat:
+        return ""
+    main, sep, sub = cat.partition('/')
+    main_n = _strip_category_prefix(main)
+    if sep:
+        sub_n = _strip_category_prefix(sub)
+        return sys.intern(f"{main_n}/{sub_n}" if sub_n else main_n)
+    return sys.intern(main_n)
+
+
+@dataclass(slots=True, frozen=True)
 class BookmarkFeatures:
     """书签特征"""
     url: str
@@ -50,7 +145,10 @@ class BookmarkFeatures:
     query_params: Dict[str, str]
     content_type: str
     language: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    # 小写副本在特征提取时计算一次，供内容类型检测、规则引擎与子分类匹配复用
+    url_lower: str = ""
+    title_lower: str = ""
+    timestamp: float = field(default_factory=time.time)
 
     @property
     def url_length(self) -> int:
@@ -66,10 +164,11 @@ class BookmarkFeatures:
 
     @property
     def has_chinese(self) -> bool:
-        return bool(re.search(r'[\u4e00-\u9fff]', self.title))
+        # 纯 ASCII 标题不可能包含中文，跳过正则
+        return not self.title.isascii() and _CJK_RE.search(self.title) is not None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClassificationResult:
     """分类结果"""
     category: str
@@ -98,11 +197,15 @@ class AIBookmarkClassifier:
         self._performance_monitor: Optional[PerformanceMonitor] = None
         self._ml_classifier: Optional[MLClassifierWrapper] = None
         self._llm_classifier: Optional[LLMClassifier] = None
+        self._llm_pool: Optional[ThreadPoolExecutor] = None
+        self._llm_pool_lock = threading.Lock()
 
-        # 缓存
-        self.feature_cache: Dict[str, BookmarkFeatures] = {}
-        self.classification_cache: Dict[str, ClassificationResult] = {}
+        # LRU 缓存（特征缓存与分类缓存共用 (url, title) 元组键）
+        self.feature_cache: "OrderedDict[Tuple[str, str], BookmarkFeatures]" = OrderedDict()
+        self.classification_cache: "OrderedDict[Tuple[str, str], ClassificationResult]" = OrderedDict()
         self._max_cache_size = 5000
+        # 分类器会被线程池并发调用，LRU 的读-调整-淘汰需要整体加锁
+        self._cache_lock = threading.Lock()
 
         # 统计
         self.stats = {
@@ -166,10 +269,25 @@ class AIBookmarkClassifier:
                 self.logger.warning(f"LLM 分类器初始化失败: {e}")
         return self._llm_classifier
 
+    @property
+    def llm_pool(self) -> ThreadPoolExecutor:
+        """LLM 并发线程池（懒加载、常驻，跨批次复用；容量为 llm.max_concurrency）"""
+        with self._llm_pool_lock:
+            if self._llm_pool is None:
+                max_concurrency = int((self.config.get('llm') or {}).get('max_concurrency', 8) or 1)
+                self._llm_pool = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix='llm')
+            return self._llm_pool
+
+    def close(self):
+        """释放常驻的 LLM 线程池"""
+        with self._llm_pool_lock:
+            if self._llm_pool is not None:
+                self._llm_pool.shutdown(wait=True)
+                self._llm_pool = None
+
     def _load_config(self) -> Dict:
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = load_json(self.config_path)
             return self._normalize_category_config(config)
         except Exception as e:
             self.logger.error(f"配置文件加载失败: {e}")
@@ -177,26 +295,12 @@ class AIBookmarkClassifier:
 
     @staticmethod
     def _strip_category_prefix(text: str) -> str:
-        if not text:
-            return ""
-        s = str(text).strip()
-        i = 0
-        while i < len(s) and not ("\u4e00" <= s[i] <= "\u9fff" or s[i].isalnum()):
-            i += 1
-        return s[i:].strip() if i < len(s) else s
+        return _strip_category_prefix(text)
 
     def _normalize_category_string(self, category: str) -> str:
         if not category:
             return ""
-        cat = str(category).strip()
-        if not cat:
-            return ""
-        if '/' in cat:
-            main, sub = cat.split('/', 1)
-            main_n = self._strip_category_prefix(main)
-            sub_n = self._strip_category_prefix(sub)
-            return f"{main_n}/{sub_n}" if sub_n else main_n
-        return self._strip_category_prefix(cat)
+        return _normalize_category(str(category))
 
     def _normalize_category_config(self, config: Dict) -> Dict:
         if not isinstance(config, dict):
@@ -241,6 +345,10 @@ class AIBookmarkClassifier:
                 new_cr[nk] = v
             normalized['category_rules'] = new_cr
 
+        hierarchy = normalized.get('category_hierarchy')
+        if isinstance(hierarchy, dict):
+            normalized['category_hierarchy'] = {sys.intern(str(k)): v for k, v in hierarchy.items()}
+
         return normalized
 
     def _get_default_config(self) -> Dict:
@@ -292,56 +400,56 @@ class AIBookmarkClassifier:
         }
 
     def extract_features(self, url: str, title: str) -> BookmarkFeatures:
-        cache_key = f"{url}::{title}"
-        if cache_key in self.feature_cache:
-            return self.feature_cache[cache_key]
+        cache_key = (url, title)
+        with self._cache_lock:
+            cached = self.feature_cache.get(cache_key)
+            if cached is not None:
+                self.feature_cache.move_to_end(cache_key)
+                return cached
 
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower().replace('www.', '')
-            path_segments = [seg for seg in parsed.path.split('/') if seg]
-
-            # 解析查询参数
-            query_params: Dict[str, str] = {}
-            if parsed.query:
-                for param in parsed.query.split('&'):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        query_params[key] = value
-
-            content_type = self._detect_content_type(url, title)
-            language = self._detect_language(title)
+            domain, path_segments, query_params = _parse_url(url)
+            url_lower = url.lower()
+            title_lower = title.lower()
 
             features = BookmarkFeatures(
                 url=url,
                 title=title,
                 domain=domain,
-                path_segments=path_segments,
-                query_params=query_params,
-                content_type=content_type,
-                language=language,
+                path_segments=list(path_segments),
+                query_params=dict(query_params),
+                content_type=_detect_content_type(url_lower, title_lower),
+                language=_detect_language(title),
+                url_lower=url_lower,
+                title_lower=title_lower,
             )
 
-            if len(self.feature_cache) < self.config.get('ai_settings', {}).get('cache_size', 10000):
+            max_features = self.config.get('ai_settings', {}).get('cache_size', 10000)
+            with self._cache_lock:
                 self.feature_cache[cache_key] = features
+                if len(self.feature_cache) > max_features:
+                    self.feature_cache.popitem(last=False)
 
             return features
         except Exception as e:
             self.logger.error(f"特征提取失败 {url}: {e}")
             return BookmarkFeatures(
-                url=url, title=title, domain="", path_segments=[], query_params={}, content_type="unknown", language="unknown"
+                url=url, title=title, domain="", path_segments=[], query_params={}, content_type="unknown", language="unknown",
+                url_lower=url.lower(), title_lower=title.lower(),
             )
 
     def classify(self, url: str, title: str) -> ClassificationResult:
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         # 缓存命中
-        cache_key = hashlib.md5(f"{url}::{title}".encode()).hexdigest()
-        if cache_key in self.classification_cache:
+        cache_key = (url, title)
+        with self._cache_lock:
+            cached = self.classification_cache.get(cache_key)
+            if cached is not None:
+                self.classification_cache.move_to_end(cache_key)
+        if cached is not None:
             self.stats['cache_hits'] += 1
-            cached = self.classification_cache[cache_key]
-            cached.processing_time = (datetime.now() - start_time).total_seconds()
-            return cached
+            return replace(cached, processing_time=time.perf_counter() - start_time)
 
         # 特征提取
         features = self.extract_features(url, title)
@@ -352,6 +460,12 @@ class AIBookmarkClassifier:
         # 1) 规则引擎
         rule_result = self.rule_engine.classify(features)
         if rule_result:
+            # 规则足够确定时提前返回，跳过 ML / 语义 / 画像 / LLM
+            early_result = self._early_exit_result(rule_result, features)
+            if early_result is not None:
+                final_result = replace(early_result, processing_time=time.perf_counter() - start_time)
+                self._record_result(cache_key, final_result)
+                return final_result
             results.append(rule_result)
 
         # 2) 机器学习
@@ -374,24 +488,148 @@ class AIBookmarkClassifier:
 
         # 5) LLM（可选）
         if self.llm_classifier and self.llm_classifier.enabled():
-            try:
-                llm_result = self.llm_classifier.classify(
-                    url,
-                    title,
-                    context={
-                        'domain': features.domain,
-                        'content_type': features.content_type,
-                        'language': features.language,
-                    },
-                )
-                if llm_result:
-                    results.append(llm_result)
-            except Exception as e:
-                self.logger.warning(f"LLM 分类调用失败: {e}")
+            llm_result = self._classify_with_llm(features)
+            if llm_result:
+                results.append(llm_result)
 
         # 融合
-        final_result = self._ensemble_classification(results, features)
+        final_result = replace(
+            self._ensemble_classification(results, features),
+            processing_time=time.perf_counter() - start_time,
+        )
+        self._record_result(cache_key, final_result)
+        return final_result
 
+    def classify_batch(self, items: List[Tuple[str, str]]) -> List[ClassificationResult]:
+        """批量分类
+
+        先一次性提取全部特征，再按子分类器分批调度（ML 单次 predict_proba，
+        LLM 有界并发），最后整批融合。结果顺序与 items 一致，缓存与统计语义同 classify()。
+        """
+        start_time = time.perf_counter()
+        final_results: List[Optional[ClassificationResult]] = [None] * len(items)
+
+        # 缓存命中 & 批内去重
+        pending: Dict[Tuple[str, str], List[int]] = {}
+        with self._cache_lock:
+            for i, (url, title) in enumerate(items):
+                cache_key = (url, title)
+                cached = self.classification_cache.get(cache_key)
+                if cached is not None:
+                    self.classification_cache.move_to_end(cache_key)
+                    self.stats['cache_hits'] += 1
+                    final_results[i] = cached
+                else:
+                    pending.setdefault(cache_key, []).append(i)
+
+        if not pending:
+            return final_results
+
+        keys = list(pending)
+        all_features = [self.extract_features(url, title) for url, title in keys]
+        ensembled: List[Optional[ClassificationResult]] = [None] * len(keys)
+
+        # 1) 规则引擎；足够确定的条目提前定案，其余条目继续后续方法
+        remaining: List[int] = []
+        rule_results: List[Dict] = []
+        for k, (features, rule_result) in enumerate(zip(all_features, self.rule_engine.classify_many(all_features))):
+            early_result = self._early_exit_result(rule_result, features) if rule_result else None
+            if early_result is not None:
+                ensembled[k] = early_result
+            else:
+                remaining.append(k)
+                rule_results.append(rule_result)
+
+        if remaining:
+            features_list = [all_features[k] for k in remaining]
+            results_by_item: List[List[ClassificationResult]] = [[] for _ in remaining]
+
+            def _collect(batch_results):
+                for bucket, res in zip(results_by_item, batch_results):
+                    if res:
+                        bucket.append(res)
+
+            _collect(rule_results)
+
+            # 2) 机器学习（整批一次预测）
+            if self.ml_classifier:
+                _collect(self.ml_classifier.classify_batch(features_list))
+
+            # 3) 语义分析
+            if self.config.get('ai_settings', {}).get('use_semantic_analysis', True):
+                _collect([self.semantic_analyzer.classify(f) for f in features_list])
+
+            # 4) 用户画像
+            if self.config.get('ai_settings', {}).get('use_user_profiling', True):
+                _collect([self.user_profiler.classify(f) for f in features_list])
+
+            # 5) LLM（可选，常驻线程池有界并发摊薄网络往返）
+            if self.llm_classifier and self.llm_classifier.enabled():
+                _collect(self.llm_pool.map(self._classify_with_llm, features_list))
+
+            # 融合（整批加权打分）
+            for k, result in zip(remaining, self._ensemble_classification_batch(results_by_item, features_list)):
+                ensembled[k] = result
+
+        per_item_time = (time.perf_counter() - start_time) / len(keys)
+        for cache_key, result in zip(keys, ensembled):
+            final_result = replace(result, processing_time=per_item_time)
+            self._record_result(cache_key, final_result)
+            for i in pending[cache_key]:
+                final_results[i] = final_result
+
+        return final_results
+
+    def _early_exit_result(self, rule_result: Dict, features: BookmarkFeatures) -> Optional[ClassificationResult]:
+        """规则命中足够强时直接以规则结果定案，否则返回 None
+
+        默认关闭：仅在配置 ai_settings.early_exit_rule_score 时启用，按最佳分类命中规则的
+        原始权重之和（而非归一化占比）判断；ai_settings.force_all_methods 为真时始终走完整融合流程。
+        结果经 _build_ensemble_result() 构建，照常应用 confidence_threshold。
+        """
+        ai_settings = self.config.get('ai_settings', {})
+        if ai_settings.get('force_all_methods', False):
+            return None
+        min_rule_score = ai_settings.get('early_exit_rule_score')
+        if min_rule_score is None:
+            return None
+        try:
+            min_rule_score = float(min_rule_score)
+        except Exception:
+            return None
+
+        method, category, confidence, reasoning, facets = self._unpack_result(rule_result)
+        rule_score = rule_result.get('rule_score', 0.0) or 0.0
+        if category == '未分类' or rule_score < min_rule_score:
+            return None
+
+        # 规则结果的 confidence / alternatives 均为占比，总和为 1
+        category_scores: Dict[str, float] = {category: confidence}
+        for cat, score in (rule_result.get('alternatives') or []):
+            cat = self._normalize_category_string(cat) or '未分类'
+            category_scores[cat] = category_scores.get(cat, 0.0) + score
+        return self._build_ensemble_result(
+            category_scores, category, 1.0,
+            list(reasoning) + [f"规则得分 {rule_score:.1f} 达到提前返回阈值 {min_rule_score:.1f}"],
+            [method], {k: v for k, v in facets.items() if v}, features, self._confidence_threshold(),
+        )
+
+    def _classify_with_llm(self, features: BookmarkFeatures) -> Optional[Dict]:
+        try:
+            return self.llm_classifier.classify(
+                features.url,
+                features.title,
+                context={
+                    'domain': features.domain,
+                    'content_type': features.content_type,
+                    'language': features.language,
+                },
+            )
+        except Exception as e:
+            self.logger.warning(f"LLM 分类调用失败: {e}")
+            return None
+
+    def _record_result(self, cache_key: Tuple[str, str], final_result: ClassificationResult):
         # 方法统计
         final_method = final_result.method
         if 'rule_engine' in final_method:
@@ -407,19 +645,44 @@ class AIBookmarkClassifier:
         if final_method == 'fallback':
             self.stats['fallback'] += 1
 
-        # 时间统计
-        final_result.processing_time = (datetime.now() - start_time).total_seconds()
-
         # 更新全局统计 & 缓存
         self._update_stats(final_result)
         self._cache_result(cache_key, final_result)
-        return final_result
 
-    def _cache_result(self, cache_key: str, result: ClassificationResult):
-        if len(self.classification_cache) >= self._max_cache_size:
-            oldest_key = next(iter(self.classification_cache))
-            del self.classification_cache[oldest_key]
-        self.classification_cache[cache_key] = result
+    def _cache_result(self, cache_key: Tuple[str, str], result: ClassificationResult):
+        with self._cache_lock:
+            self.classification_cache[cache_key] = result
+            self.classification_cache.move_to_end(cache_key)
+            if len(self.classification_cache) > self._max_cache_size:
+                self.classification_cache.popitem(last=False)
+
+    def _unpack_result(self, res) -> Tuple[str, str, float, List[str], Dict[str, str]]:
+        """统一子分类器结果（dict 或 ClassificationResult）为 (method, category, confidence, reasoning, facets)"""
+        if isinstance(res, dict):
+            method = res.get('method', 'unknown')
+            category = self._normalize_category_string(res.get('category', '未分类')) or '未分类'
+            confidence = res.get('confidence', 0.0)
+            reasoning = res.get('reasoning', [])
+            facets = res.get('facets', {}) or {}
+        else:
+            method = res.method
+            category = self._normalize_category_string(res.category) or '未分类'
+            confidence = res.confidence
+            reasoning = res.reasoning
+            facets = getattr(res, 'facets', {}) or {}
+        return method, category, confidence, reasoning, facets
+
+    def _confidence_threshold(self) -> float:
+        threshold = self.config.get('ai_settings', {}).get('confidence_threshold', 0.7)
+        try:
+            threshold = float(threshold)
+        except Exception:
+            threshold = 0.7
+        if threshold < 0:
+            threshold = 0.0
+        if threshold > 1:
+            threshold = 1.0
+        return threshold
 
     def _ensemble_classification(self, results: List[ClassificationResult], features: BookmarkFeatures) -> ClassificationResult:
         if not results:
@@ -436,29 +699,10 @@ class AIBookmarkClassifier:
         methods_used: List[str] = []
         merged_facets: Dict[str, str] = {}
 
-        method_weights = {
-            'rule_engine': 0.35,
-            'machine_learning': 0.25,
-            'semantic_analyzer': 0.15,
-            'user_profiler': 0.10,
-            'llm': 0.50,
-        }
-
         for res in results:
-            if isinstance(res, dict):
-                method = res.get('method', 'unknown')
-                category = self._normalize_category_string(res.get('category', '未分类')) or '未分类'
-                confidence = res.get('confidence', 0.0)
-                reasoning = res.get('reasoning', [])
-                facets = res.get('facets', {}) or {}
-            else:
-                method = res.method
-                category = self._normalize_category_string(res.category) or '未分类'
-                confidence = res.confidence
-                reasoning = res.reasoning
-                facets = getattr(res, 'facets', {}) or {}
+            method, category, confidence, reasoning, facets = self._unpack_result(res)
 
-            weight = method_weights.get(method, 0.1)
+            weight = METHOD_WEIGHTS.get(method, DEFAULT_METHOD_WEIGHT)
             category_scores[category] += confidence * weight
             all_reasoning.extend(reasoning)
             methods_used.append(method)
@@ -476,29 +720,103 @@ class AIBookmarkClassifier:
             )
 
         best_category = max(category_scores, key=category_scores.get)
+        return self._build_ensemble_result(
+            category_scores, best_category, sum(category_scores.values()),
+            all_reasoning, methods_used, merged_facets, features, self._confidence_threshold(),
+        )
+
+    def _ensemble_classification_batch(
+        self,
+        results_by_item: List[List[ClassificationResult]],
+        features_list: List[BookmarkFeatures],
+    ) -> List[ClassificationResult]:
+        """批量融合：各条目的加权得分累加到 (N, C) 矩阵，一次 argmax 选出最佳分类
+
+        与逐条 _ensemble_classification() 结果一致（同分时取该条目中最先出现的分类）。
+        """
+        n_items = len(results_by_item)
+        category_index: Dict[str, int] = {}
+        item_idx: List[int] = []
+        cat_idx: List[int] = []
+        weighted: List[float] = []
+        item_categories: List[List[int]] = [[] for _ in range(n_items)]
+        item_reasoning: List[List[str]] = [[] for _ in range(n_items)]
+        item_methods: List[List[str]] = [[] for _ in range(n_items)]
+        item_facets: List[Dict[str, str]] = [{} for _ in range(n_items)]
+
+        for i, results in enumerate(results_by_item):
+            seen = item_categories[i]
+            all_reasoning = item_reasoning[i]
+            methods_used = item_methods[i]
+            merged_facets = item_facets[i]
+            for res in results:
+                method, category, confidence, reasoning, facets = self._unpack_result(res)
+                j = category_index.setdefault(category, len(category_index))
+                if j not in seen:
+                    seen.append(j)
+                item_idx.append(i)
+                cat_idx.append(j)
+                weighted.append(confidence * METHOD_WEIGHTS.get(method, DEFAULT_METHOD_WEIGHT))
+                all_reasoning.extend(reasoning)
+                methods_used.append(method)
+                for k, v in facets.items():
+                    if v and k not in merged_facets:
+                        merged_facets[k] = v
+
+        if not category_index:
+            return [self._ensemble_classification([], features) for features in features_list]
+
+        categories = list(category_index)
+        scores = np.zeros((n_items, len(categories)))
+        np.add.at(scores, (item_idx, cat_idx), weighted)
+        # 同分裁决：记录每个分类在条目内首次出现的次序，缺席分类为 +inf
+        first_seen = np.full((n_items, len(categories)), np.inf)
+        for i, seen in enumerate(item_categories):
+            first_seen[i, seen] = np.arange(len(seen))
+
+        present = np.isfinite(first_seen)
+        masked = np.where(present, scores, -np.inf)
+        is_top = present & (masked == masked.max(axis=1, keepdims=True))
+        best = np.where(is_top, first_seen, np.inf).argmin(axis=1)
+        totals = scores.sum(axis=1)
+
+        threshold = self._confidence_threshold()
+        final_results: List[ClassificationResult] = []
+        for i, features in enumerate(features_list):
+            if not results_by_item[i]:
+                final_results.append(self._ensemble_classification([], features))
+                continue
+            row = scores[i]
+            category_scores = {categories[j]: float(row[j]) for j in item_categories[i]}
+            final_results.append(self._build_ensemble_result(
+                category_scores, categories[best[i]], float(totals[i]),
+                item_reasoning[i], item_methods[i], item_facets[i], features, threshold,
+            ))
+        return final_results
+
+    def _build_ensemble_result(
+        self,
+        category_scores: Dict[str, float],
+        best_category: str,
+        total_score: float,
+        all_reasoning: List[str],
+        methods_used: List[str],
+        merged_facets: Dict[str, str],
+        features: BookmarkFeatures,
+        threshold: float,
+    ) -> ClassificationResult:
         top_score = category_scores[best_category]
-        total_score = sum(category_scores.values())
         confidence = top_score / total_score if total_score > 0 else 0.0
 
         alternatives = [
             (cat, score / total_score) for cat, score in category_scores.items() if cat != best_category and total_score > 0
         ]
-        alternatives.sort(key=lambda x: x[1], reverse=True)
+        alternatives.sort(key=itemgetter(1), reverse=True)
 
         subcategory = self._determine_subcategory(best_category, features)
 
         final_method = '+'.join(set(methods_used)) if methods_used else 'unknown'
 
-        threshold = self.config.get('ai_settings', {}).get('confidence_threshold', 0.7)
-        try:
-            threshold = float(threshold)
-        except Exception:
-            threshold = 0.7
-        if threshold < 0:
-            threshold = 0.0
-        if threshold > 1:
-            threshold = 1.0
-
         if best_category != "未分类" and confidence < threshold:
             threshold_reasoning = list(all_reasoning)
             threshold_reasoning.append(
@@ -534,38 +852,12 @@ class AIBookmarkClassifier:
         hierarchy = self.config.get('category_hierarchy', {})
         if category in hierarchy:
             subs = hierarchy[category]
-            title_lower = features.title.lower()
+            title_lower = features.title_lower or features.title.lower()
             for sub in subs:
                 if sub.lower() in title_lower:
                     return sub
         return None
 
-    def _detect_content_type(self, url: str, title: str) -> str:
-        url_lower = url.lower()
-        title_lower = title.lower()
-
-        if any(domain in url_lower for domain in ['youtube.com', 'bilibili.com', 'vimeo.com']):
-            return 'video'
-        if any(domain in url_lower for domain in ['github.com', 'gitlab.com']):
-            return 'code_repository'
-        if any(pattern in url_lower for pattern in ['docs.', 'documentation', 'wiki']):
-            return 'documentation'
-        if any(domain in url_lower for domain in ['arxiv.org', 'acm.org', 'ieee.org']):
-            return 'academic_paper'
-        if any(keyword in title_lower for keyword in ['news', '新闻', 'breaking']):
-            return 'news'
-        if any(keyword in title_lower for keyword in ['tool', '工具', 'online', 'generator']):
-            return 'online_tool'
-        return 'webpage'
-
-    def _detect_language(self, title: str) -> str:
-        if re.search(r'[\u4e00-\u9fff]', title):
-            return 'zh'
-        elif re.search(r'[a-zA-Z]', title):
-            return 'en'
-        else:
-            return 'unknown'
-
     def _update_stats(self, result: ClassificationResult):
         self.stats['total_classified'] += 1
         total = self.stats['total_classified']
@@ -577,9 +869,8 @@ class AIBookmarkClassifier:
         self.user_profiler.update_preferences(features, correct_category)
         if self.ml_classifier:
             self.ml_classifier.online_learn(features, correct_category)
-        cache_key = hashlib.md5(f"{url}::{title}".encode()).hexdigest()
-        if cache_key in self.classification_cache:
-            del self.classification_cache[cache_key]
+        with self._cache_lock:
+            self.classification_cache.pop((url, title), None)
         self.logger.debug(f"学习反馈: {predicted_category} -> {correct_category}")
 
     def get_statistics(self) -> Dict:
@@ -612,8 +903,7 @@ class AIBookmarkClassifier:
             'user_profile': self.user_profiler.export_profile(),
             'config': self.config,
         }
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(model_data, f, ensure_ascii=False, indent=2)
+        dump_json(model_data, path)
         if self.ml_classifier:
             self.ml_classifier.save_model()
         self.logger.info(f"模型已保存到: {path}")
@@ -623,8 +913,7 @@ class AIBookmarkClassifier:
             self.logger.warning(f"模型文件不存在: {path}")
             return
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                model_data = json.load(f)
+            model_data = load_json(path)
             self.stats = model_data.get('stats', self.stats)
             self.user_profiler.import_profile(model_data.get('user_profile', {}))
             if self.ml_classifier:
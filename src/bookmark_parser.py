@@ -0,0 +1,135 @@
+"""
+Bookmark Parser - 书签文件流式解析
+
+职责：
+- 从浏览器导出的 HTML 书签文件中提取 <A> 标签（href、文本、时间属性）
+- 分块读取并流式解析，不构建完整 DOM，内存占用与链接数量成正比
+- 优先使用 lxml 的 target 解析接口；缺少 lxml 时回退到标准库 html.parser
+"""
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# 分块读取大小
+CHUNK_SIZE = 1 << 16
+
+# 有效书签 URL 的前缀（大小写敏感，与浏览器导出格式一致），供加载器作为 href_prefixes 传入
+VALID_URL_PREFIXES = ('http://', 'https://')
+
+
+class AnchorLink(NamedTuple):
+    """书签文件中的一个链接"""
+    href: str
+    text: str
+    add_date: str = ""
+    last_modified: str = ""
+
+
+class _AnchorCollector:
+    """收集 <A HREF=...> 链接的解析回调（lxml target 与 html.parser 共用）"""
+
+    def __init__(self, href_prefixes: Optional[Tuple[str, ...]] = None):
+        self.links: List[AnchorLink] = []
+        self.href_prefixes = href_prefixes
+        self._attrs: Optional[dict] = None
+        self._text: List[str] = []
+
+    def start(self, tag: str, attrs: dict):
+        if tag.lower() == 'a' and 'href' in attrs:
+            # 前缀不符的链接在解析回调内直接跳过，不收集文本也不构造 AnchorLink
+            if self.href_prefixes and not (attrs['href'] or '').lstrip().startswith(self.href_prefixes):
+                return
+            self._attrs = attrs
+            self._text = []
+
+    def data(self, data: str):
+        if self._attrs is not None:
+            self._text.append(data)
+
+    def end(self, tag: str):
+        if tag.lower() == 'a' and self._attrs is not None:
+            attrs = self._attrs
+            self.links.append(AnchorLink(
+                href=attrs.get('href') or '',
+                text=''.join(self._text),
+                add_date=attrs.get('add_date') or '',
+                last_modified=attrs.get('last_modified') or '',
+            ))
+            self._attrs = None
+            self._text = []
+
+    def close(self) -> List[AnchorLink]:
+        return self.links
+
+
+class _StdlibAnchorParser(HTMLParser):
+    """标准库回退实现：将 html.parser 事件转发给 _AnchorCollector"""
+
+    def __init__(self, collector: _AnchorCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, dict(attrs))
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+
+def iter_bookmark_links(
+    file_path: str,
+    encoding: str = 'utf-8',
+    href_prefixes: Optional[Tuple[str, ...]] = None,
+) -> Iterator[AnchorLink]:
+    """流式解析书签文件，按文档顺序逐个产出带 href 的链接
+
+    每喂入一个数据块就交出已解析出的链接，调用方无需等整个文件解析完成，
+    解析器本身也不保留已处理的元素。指定 href_prefixes 时只产出 href
+    （去除前导空白后）以这些前缀开头的链接。
+    """
+    collector = _AnchorCollector(href_prefixes)
+    links = collector.links
+
+    if etree is not None:
+        parser = etree.HTMLParser(target=collector, encoding=encoding)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                parser.feed(chunk)
+                if links:
+                    yield from links
+                    links.clear()
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # 空文件等无可解析内容的情况
+            pass
+        yield from links
+        return
+
+    parser = _StdlibAnchorParser(collector)
+    with open(file_path, 'r', encoding=encoding) as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), ''):
+            parser.feed(chunk)
+            if links:
+                yield from links
+                links.clear()
+    parser.close()
+    yield from links
+
+
+def parse_bookmark_links(
+    file_path: str,
+    encoding: str = 'utf-8',
+    href_prefixes: Optional[Tuple[str, ...]] = None,
+) -> List[AnchorLink]:
+    """解析书签文件，返回所有带 href 的链接（保持文档顺序）"""
+    return list(iter_bookmark_links(file_path, encoding, href_prefixes))
@@ -9,18 +9,24 @@ import logging
 import os
 import time
 import re
+import sys
+import threading
 from .emoji_cleaner import clean_title as clean_emoji_title
 
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, urlunsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from collections import OrderedDict, defaultdict
 from datetime import datetime
+from operator import itemgetter
 
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-from .ai_classifier import AIBookmarkClassifier
+import numpy as np
+
+from .bookmark_parser import VALID_URL_PREFIXES, iter_bookmark_links
+from .json_io import load_json
+from .classification_store import ClassificationStore, config_fingerprint
+from .ai_classifier import AIBookmarkClassifier, _normalize_category, _strip_category_prefix
 from .taxonomy_standardizer import TaxonomyStandardizer
 
 try:
@@ -33,6 +39,55 @@ from .placeholder_modules import (
     DataExporter, BookmarkDeduplicator, HealthChecker
 )
 
+# 分类结果缓存条目数
+CLASSIFICATION_CACHE_SIZE = 10000
+
+# 线程池路径每个任务批量分类的最大书签数（分类器 classify_batch 整批提取特征、ML 单次预测）
+CLASSIFY_BATCH_SIZE = 512
+
+# 分类器使用的默认学习数据与模型目录（UserProfiler / MLClassifierWrapper 的默认路径），计入持久化缓存指纹
+USER_PROFILE_FILE = 'user_profile.json'
+ML_MODEL_DIR = os.path.join('models', 'ml')
+
+# 多文件并行加载的线程数上限：按 CPU 核数的 2 倍取值（读文件与解析交替进行），最多 8 个
+FILE_LOAD_MAX_WORKERS = min(8, (os.cpu_count() or 4) * 2)
+
+# 进程池工作进程内的处理器（由 initializer 每进程构建一次）
+_worker_processor: Optional['BookmarkProcessor'] = None
+
+def _init_classify_worker(config_path: str, use_ml: bool, confidence_threshold: Optional[float]):
+    """进程池初始化：每个工作进程只加载一次配置与分类器"""
+    global _worker_processor
+    _worker_processor = BookmarkProcessor(
+        config_path, max_workers=1, use_ml=use_ml, confidence_threshold=confidence_threshold
+    )
+
+def _classify_in_worker(key: Tuple[str, str]) -> Optional[Dict]:
+    """在工作进程中分类单个 (url, title)，失败返回 None"""
+    try:
+        return _worker_processor._classify_core(*key)
+    except Exception:
+        return None
+
+# 取值很少、会在大量书签间重复的分类结果字段
+_INTERNED_RESULT_FIELDS = ('category', 'subcategory', 'method')
+
+def _intern_result_strings(data: Dict) -> Dict:
+    """驻留反序列化得到的分类结果字符串（进程间传回或从持久化缓存读出时每条都是新对象）"""
+    for field in _INTERNED_RESULT_FIELDS:
+        value = data.get(field)
+        if type(value) is str:
+            data[field] = sys.intern(value)
+    return data
+
+def _url_dedup_key(url: str) -> str:
+    """快速去重键：协议与主机小写，去掉片段与路径末尾斜杠（路径、查询大小写保持原样）"""
+    try:
+        scheme, netloc, path, query, _fragment = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit((scheme.lower(), netloc.lower(), path.rstrip('/'), query, ''))
+
 class BookmarkProcessor:
     """书签处理器主类"""
     
@@ -42,11 +97,14 @@ class BookmarkProcessor:
         max_workers: int = 4,
         use_ml: bool = True,
         confidence_threshold: Optional[float] = None,
+        use_processes: bool = False,
     ):
         self.config_path = config_path
         # 优化线程池大小：限制最大线程数避免过度竞争
         self.max_workers = min(max_workers, 32)  # 限制最大32线程
         self.use_ml = use_ml
+        # 多进程分类：ML 推理与特征提取为 CPU 密集型，线程受 GIL 限制
+        self.use_processes = use_processes
 
         self.confidence_threshold: Optional[float] = None
         if confidence_threshold is not None:
@@ -64,8 +122,7 @@ class BookmarkProcessor:
         
         # 初始化组件
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = load_json(config_path)
             self._config_load_ok = True
         except (FileNotFoundError, json.JSONDecodeError) as e:
             self.logger.error(f"无法加载或解析配置文件 {config_path}: {e}")
@@ -90,11 +147,16 @@ class BookmarkProcessor:
         self._health_checker = None
         self._exporter = None
         self._llm_organizer = None
+        self._classify_pool: Optional[ThreadPoolExecutor] = None
+        self._classification_store: Optional[ClassificationStore] = None
         self.llm_organizer_meta: Optional[Dict] = None
         
-        # 缓存和性能优化
-        self._classification_cache = {}
-        self._url_validation_cache = {}
+        # 缓存和性能优化：按 (url, title) 缓存规范化后的分类结果（LRU 淘汰），
+        # 批量分类前先挑出未命中的键，只把未命中部分交给分类器
+        self._result_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._result_cache_hits = 0
+        self._result_cache_misses = 0
         
         # 处理统计
         self.stats = {
@@ -107,16 +169,12 @@ class BookmarkProcessor:
             'files_processed': 0,
             'llm_organizer_used': False,
         }
+        # 多文件并行加载时，加载线程更新错误计数需加锁
+        self._stats_lock = threading.Lock()
 
     @staticmethod
     def _strip_category_prefix(text: str) -> str:
-        if not text:
-            return ""
-        s = str(text).strip()
-        i = 0
-        while i < len(s) and not ("\u4e00" <= s[i] <= "\u9fff" or s[i].isalnum()):
-            i += 1
-        return s[i:].strip() if i < len(s) else s
+        return _strip_category_prefix(text)
 
     def _normalize_category_config(self, config: Dict) -> Dict:
         if not isinstance(config, dict):
@@ -164,17 +222,10 @@ class BookmarkProcessor:
         return normalized
 
     def _normalize_category_string(self, category: str) -> str:
+        """规范化分类名（与分类器共用带缓存、驻留结果的实现）"""
         if not category:
             return ""
-        cat = str(category).strip()
-        if not cat:
-            return ""
-        if '/' in cat:
-            main, sub = cat.split('/', 1)
-            main_n = self._strip_category_prefix(main)
-            sub_n = self._strip_category_prefix(sub)
-            return f"{main_n}/{sub_n}" if sub_n else main_n
-        return self._strip_category_prefix(cat)
+        return _normalize_category(str(category))
     
     @property
     def classifier(self):
@@ -191,6 +242,58 @@ class BookmarkProcessor:
                 ai_settings['confidence_threshold'] = self.confidence_threshold
         return self._classifier
     
+    @property
+    def classify_pool(self) -> ThreadPoolExecutor:
+        """Lazy loading classification thread pool (reused across batches and process_files calls)"""
+        if self._classify_pool is None:
+            self._classify_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='clf')
+        return self._classify_pool
+    
+    @property
+    def classification_store(self) -> Optional[ClassificationStore]:
+        """Lazy loading persistent classification cache (enabled by ai_settings.persistent_cache_path)"""
+        if self._classification_store is None:
+            ai_settings = self.config.get('ai_settings')
+            path = ai_settings.get('persistent_cache_path') if isinstance(ai_settings, dict) else None
+            if path:
+                try:
+                    self._classification_store = ClassificationStore(
+                        path, config_fingerprint(self.config, self.use_ml, self._fingerprint_files())
+                    )
+                except Exception as e:
+                    self.logger.warning(f"无法打开分类结果缓存 {path}: {e}")
+        return self._classification_store
+    
+    def _fingerprint_files(self) -> List[str]:
+        """除配置外会影响分类结果的文件：受控词表、用户画像学习数据与（启用时）ML 模型目录"""
+        taxonomy = self.config.get('taxonomy')
+        taxonomy = taxonomy if isinstance(taxonomy, dict) else {}
+        files = [
+            taxonomy.get('subjects_file', 'taxonomy/subjects.yaml'),
+            taxonomy.get('resource_types_file', 'taxonomy/resource_types.yaml'),
+            USER_PROFILE_FILE,
+        ]
+        if self.use_ml:
+            files.append(ML_MODEL_DIR)
+        return files
+    
+    def close(self):
+        """释放常驻线程池与分类结果缓存"""
+        if self._classify_pool is not None:
+            self._classify_pool.shutdown(wait=True)
+            self._classify_pool = None
+        if self._classifier is not None:
+            self._classifier.close()
+        if self._classification_store is not None:
+            self._classification_store.close()
+            self._classification_store = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
     @property
     def deduplicator(self):
         """Lazy loading deduplicator"""
@@ -232,9 +335,6 @@ class BookmarkProcessor:
     def process_files(self, input_files: List[str], output_dir: str = "output", 
                      train_models: bool = False) -> Dict:
         """处理多个书签文件"""
-        if BeautifulSoup is None:
-            raise ImportError("缺少依赖 beautifulsoup4（bs4），请先安装：pip install beautifulsoup4")
-
         start_time = time.time()
         
         self.logger.info(f"开始处理 {len(input_files)} 个文件")
@@ -243,20 +343,12 @@ class BookmarkProcessor:
         os.makedirs(output_dir, exist_ok=True)
         
         # 并行加载所有书签以加速IO操作
+        # map 按输入文件顺序返回结果，跨文件去重时保留的"首次出现"书签与完成先后无关
         all_bookmarks = []
-        with ThreadPoolExecutor(max_workers=min(len(input_files), 8)) as file_executor:
-            file_futures = {file_executor.submit(self._load_bookmarks_from_file, file_path): file_path 
-                          for file_path in input_files}
-            
-            for future in as_completed(file_futures):
-                file_path = file_futures[future]
-                try:
-                    bookmarks = future.result()
-                    all_bookmarks.extend(bookmarks)
-                    self.stats['files_processed'] += 1
-                except Exception as e:
-                    self.logger.error(f"加载文件失败 {file_path}: {e}")
-                    self.stats['errors'] += 1
+        with ThreadPoolExecutor(max_workers=min(len(input_files), FILE_LOAD_MAX_WORKERS)) as file_executor:
+            for bookmarks in file_executor.map(self._load_bookmarks_from_file, input_files):
+                all_bookmarks.extend(bookmarks)
+                self.stats['files_processed'] += 1
         
         self.stats['total_bookmarks'] = len(all_bookmarks)
         
@@ -266,25 +358,27 @@ class BookmarkProcessor:
         
         # 优化去重处理：先进行快速URL去重
         self.logger.info("开始快速去重处理...")
-        # 快速URL去重
-        seen_urls = set()
-        fast_unique = []
+        # 快速URL去重：dict 保持插入顺序，setdefault 一次哈希探测即可保留首次出现的书签；
+        # 键为规范化 URL，仅片段、末尾斜杠或主机大小写不同的镜像链接在此即被合并
+        first_by_url: Dict[str, Dict] = {}
         for bookmark in all_bookmarks:
-            url = bookmark.get('url', '')
-            if url not in seen_urls:
-                seen_urls.add(url)
-                fast_unique.append(bookmark)
+            first_by_url.setdefault(_url_dedup_key(bookmark.get('url', '')), bookmark)
+        fast_unique = list(first_by_url.values())
         
         fast_duplicates_removed = len(all_bookmarks) - len(fast_unique)
         self.logger.info(f"快速去重移除了 {fast_duplicates_removed} 个重复书签")
+        # 后续各阶段只持有上一阶段的结果：中间列表用完即释放，重复书签不再存活到导出结束
+        del all_bookmarks, first_by_url
         
         # 对剩余书签执行高级去重（始终执行，提升跨浏览器合并的去重质量）
         unique_bookmarks, duplicates = self.deduplicator.remove_duplicates(fast_unique)
         self.stats['duplicates_removed'] = fast_duplicates_removed + len(duplicates)
+        del fast_unique, duplicates
         
-        # 并行分类处理
+        # 并行分类处理（分类字段就地写回书签字典）
         self.logger.info(f"开始分类 {len(unique_bookmarks)} 个书签...")
         classified_bookmarks = self._classify_bookmarks_parallel(unique_bookmarks)
+        del unique_bookmarks
         
         # 组织分类结果
         organized_bookmarks = self._organize_bookmarks(classified_bookmarks)
@@ -302,7 +396,8 @@ class BookmarkProcessor:
                 llm_result = None
 
             if llm_result and llm_result.get('organized'):
-                organized_bookmarks = llm_result['organized']
+                # _organize_bookmarks 的结果已排序，只有被 LLM 结构替换时才需要重新统一排序
+                organized_bookmarks = self._sort_organized_structure(llm_result['organized'])
                 self.llm_organizer_meta = llm_result.get('meta')
                 self.stats['llm_organizer_used'] = True
                 if self.llm_organizer_meta:
@@ -318,8 +413,6 @@ class BookmarkProcessor:
             if 'llm_organizer_meta' in self.stats:
                 self.stats.pop('llm_organizer_meta', None)
 
-        organized_bookmarks = self._sort_organized_structure(organized_bookmarks)
-        
         # 更新统计
         self.stats['processing_time'] = time.time() - start_time
         self.stats['processed_bookmarks'] = len(classified_bookmarks)
@@ -340,194 +433,307 @@ class BookmarkProcessor:
         bookmarks = []
 
         try:
-            if BeautifulSoup is None:
-                raise ImportError("缺少依赖 beautifulsoup4（bs4），请先安装：pip install beautifulsoup4")
-
-            # 使用更快的解析器
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 使用lxml解析器如果可用，否则使用html.parser
-            try:
-                soup = BeautifulSoup(content, 'lxml')
-            except:
-                soup = BeautifulSoup(content, 'html.parser')
-            
-            links = soup.find_all('a', href=True)  # 只查找有href的链接
-            
-            for link in links:
-                url = link.get('href', '').strip()
-                title_raw = (link.string or link.get_text() or '').strip()
+            # 流式解析，只收集 http(s) 链接的 <A> 标签（在解析回调内过滤），不构建完整 DOM
+            for link in iter_bookmark_links(file_path, href_prefixes=VALID_URL_PREFIXES):
+                url = link.href.strip()
                 # 统一使用预处理模块清理标题前缀emoji，防止多次导出叠加
-                title = clean_emoji_title(title_raw)
+                title = clean_emoji_title(link.text.strip())
 
-                if url and title and self._is_valid_url(url):
+                if title:
                     bookmarks.append({
                         'url': url,
                         'title': title,
                         'source_file': file_path,
-                        'add_date': link.get('add_date', ''),
-                        'last_modified': link.get('last_modified', '')
+                        'add_date': link.add_date,
+                        'last_modified': link.last_modified
                     })
             
             self.logger.info(f"从 {file_path} 加载了 {len(bookmarks)} 个书签")
             
         except Exception as e:
             self.logger.error(f"加载文件失败 {file_path}: {e}")
-            self.stats['errors'] += 1
+            with self._stats_lock:
+                self.stats['errors'] += 1
         
         return bookmarks
     
-    def _is_valid_url(self, url: str) -> bool:
-        """验证URL有效性"""
-        if not url:
-            return False
-        
-        # 过滤无效URL
-        invalid_prefixes = ['javascript:', 'data:', 'chrome:', 'about:', 'file:', 'mailto:']
-        for prefix in invalid_prefixes:
-            if url.lower().startswith(prefix):
-                return False
-        
-        return url.startswith(('http://', 'https://'))
-    
     def _classify_bookmarks_parallel(self, bookmarks: List[Dict]) -> List[Dict]:
-        """优化的并行分类书签"""
-        classified_bookmarks = []
-        batch_size = 100  # 批处理大小
+        """优化的并行分类书签（复用常驻线程池，结果保持输入顺序）"""
+        if self.use_processes:
+            classified_bookmarks = self._classify_bookmarks_in_processes(bookmarks)
+        else:
+            classified_bookmarks = self._classify_bookmarks_in_threads(bookmarks)
         
-        # 分批处理以减少内存使用和提高效率
-        for i in range(0, len(bookmarks), batch_size):
-            batch = bookmarks[i:i + batch_size]
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # 提交分类任务
-                future_to_bookmark = {
-                    executor.submit(self._classify_single_bookmark_cached, bookmark): bookmark
-                    for bookmark in batch
-                }
-                
-                # 收集结果
-                batch_results = []
-                for future in as_completed(future_to_bookmark):
-                    bookmark = future_to_bookmark[future]
-                    
-                    try:
-                        result = future.result(timeout=30)  # 添加超时
-                        if result:
-                            batch_results.append(result)
-                            
-                    except Exception as e:
-                        self.logger.error(f"分类失败 {bookmark.get('url', 'unknown')}: {e}")
-                        self.stats['errors'] += 1
-                
-                classified_bookmarks.extend(batch_results)
+        if self.classification_store is not None:
+            self.classification_store.flush()
+        return classified_bookmarks
+    
+    def _classify_bookmarks_in_threads(self, bookmarks: List[Dict]) -> List[Dict]:
+        """线程池并行分类（复用常驻线程池，结果保持输入顺序）
+        
+        内存缓存命中的书签在主线程直接写回，只有未命中的书签提交到线程池。
+        ThreadPoolExecutor.map 会忽略 chunksize、仍为每个元素创建 Future，
+        因此先手动切块，每块作为一个任务提交并整块批量分类。
+        """
+        total = len(bookmarks)
+        progress_window = 100  # 进度日志间隔
+        
+        misses = []
+        with self._result_cache_lock:
+            for bookmark in bookmarks:
+                key = (bookmark['url'], bookmark['title'])
+                cached_data = self._result_cache.get(key)
+                if cached_data is None:
+                    misses.append(bookmark)
+                else:
+                    self._result_cache.move_to_end(key)
+                    bookmark.update(cached_data)
+            self._result_cache_hits += total - len(misses)
+        
+        completed = total - len(misses)
+        if completed:
+            self.logger.info(f"分类缓存命中: {completed}/{total}")
+        
+        failed = set()
+        chunksize = max(1, min(CLASSIFY_BATCH_SIZE, len(misses) // (self.max_workers * 4) or 1))
+        chunks = [misses[i:i + chunksize] for i in range(0, len(misses), chunksize)]
+        for chunk, chunk_results in zip(chunks, self.classify_pool.map(self._classify_bookmark_chunk, chunks)):
+            for bookmark, result in zip(chunk, chunk_results):
+                completed += 1
+                if not result:
+                    failed.add(id(bookmark))
                 
                 # 显示进度
-                completed = i + len(batch)
-                progress = min(completed / len(bookmarks) * 100, 100)
-                self.logger.info(f"分类进度: {progress:.1f}% ({completed}/{len(bookmarks)})")
+                if completed % progress_window == 0 or completed == total:
+                    progress = completed / total * 100
+                    self.logger.info(f"分类进度: {progress:.1f}% ({completed}/{total})")
+        
+        if not failed:
+            return list(bookmarks)
+        return [bookmark for bookmark in bookmarks if id(bookmark) not in failed]
+    
+    def _classify_bookmark_chunk(self, bookmarks: List[Dict]) -> List[Optional[Dict]]:
+        """在单个工作线程内批量分类一块书签（分类字段直接写回书签字典）"""
+        try:
+            keys = [(bookmark['url'], bookmark['title']) for bookmark in bookmarks]
+            results = self._classify_keys(keys)
+        except Exception as e:
+            # 整批失败时逐条重试，只丢弃确实无法分类的书签
+            self.logger.error(f"批量分类失败，改为逐条分类: {e}")
+            return [self._classify_single_bookmark_cached(bookmark) for bookmark in bookmarks]
+        
+        for bookmark, cached_data in zip(bookmarks, results):
+            bookmark.update(cached_data)
+        return bookmarks
+    
+    def _classify_bookmarks_in_processes(self, bookmarks: List[Dict]) -> List[Dict]:
+        """进程池并行分类（相同 (url, title) 只分类一次，按块分发，结果保持输入顺序）
+        
+        工作进程各自持有分类器，分类器内部统计不回写到主进程。
+        """
+        keys = list(dict.fromkeys((b.get('url', ''), b.get('title', '')) for b in bookmarks))
+        results: Dict[Tuple[str, str], Optional[Dict]] = {}
+        categories_found = self.stats['categories_found']
+        
+        # 持久化缓存命中的结果无需提交到工作进程
+        store = self.classification_store
+        if store is not None:
+            pending_keys = []
+            for key in keys:
+                stored = store.get(*key)
+                if stored is None:
+                    pending_keys.append(key)
+                    continue
+                results[key] = _intern_result_strings(stored)
+                categories_found[stored['category']] = categories_found.get(stored['category'], 0) + 1
+            keys = pending_keys
+        
+        total = len(keys)
+        progress_window = 100  # 进度日志间隔
+        # 工作进程数不超过 CPU 核数与待分类数：多出的进程只会重复加载配置与模型
+        workers = max(1, min(self.max_workers, os.cpu_count() or 1, total))
+        chunksize = max(1, min(512, total // (workers * 4) or 1))
+        
+        # 全部命中持久化缓存时不启动进程池
+        if keys:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_classify_worker,
+                initargs=(self.config_path, self.use_ml, self.confidence_threshold)
+            ) as executor:
+                for completed, (key, result) in enumerate(
+                    zip(keys, executor.map(_classify_in_worker, keys, chunksize=chunksize)), 1
+                ):
+                    if result is None:
+                        self.logger.error(f"单个书签分类失败: {key[0]}")
+                    else:
+                        result = _intern_result_strings(result)
+                        category = result['category']
+                        categories_found[category] = categories_found.get(category, 0) + 1
+                        if store is not None:
+                            store.put(*key, result)
+                    results[key] = result
+                    
+                    if completed % progress_window == 0 or completed == total:
+                        progress = completed / total * 100
+                        self.logger.info(f"分类进度: {progress:.1f}% ({completed}/{total})")
         
+        classified_bookmarks = []
+        for bookmark in bookmarks:
+            result = results[(bookmark.get('url', ''), bookmark.get('title', ''))]
+            if result is not None:
+                bookmark.update(result)
+                classified_bookmarks.append(bookmark)
         return classified_bookmarks
     
     def _classify_single_bookmark_cached(self, bookmark: Dict) -> Optional[Dict]:
-        """带缓存的单个书签分类"""
+        """带缓存的单个书签分类（分类字段直接写回书签字典，不另建新字典）"""
         try:
-            url = bookmark['url']
-            title = bookmark['title']
-            
-            # 创建缓存键
-            cache_key = f"{url}|{title}"
-            
-            # 检查缓存
-            if cache_key in self._classification_cache:
-                cached_result = self._classification_cache[cache_key]
-                return {
-                    **bookmark,
-                    **cached_result
-                }
-            
-            # 使用AI分类器
-            result = self.classifier.classify(url, title)
-            
-            # 处理分类结果（可能是对象或字典）
-            if hasattr(result, 'category'):
-                # ClassificationResult对象
-                cached_data = {
-                    'category': self._normalize_category_string(result.category),
-                    'subcategory': result.subcategory if hasattr(result, 'subcategory') else None,
-                    'confidence': result.confidence,
-                    'alternatives': result.alternatives if hasattr(result, 'alternatives') else [],
-                    'reasoning': result.reasoning if hasattr(result, 'reasoning') else [],
-                    'method': result.method if hasattr(result, 'method') else 'unknown',
-                    'processing_time': result.processing_time if hasattr(result, 'processing_time') else 0.0,
-                    'facets': result.facets if hasattr(result, 'facets') else {}
-                }
+            cached_data = self._classify_keys([(bookmark['url'], bookmark['title'])])[0]
+            bookmark.update(cached_data)
+            return bookmark
+        except Exception as e:
+            self.logger.error(f"单个书签分类失败: {e}")
+            return None
+    
+    def _classify_keys(self, keys: List[Tuple[str, str]]) -> List[Dict]:
+        """按 (url, title) 批量取得规范化分类结果（返回值不可修改）
+        
+        依次查内存 LRU 缓存、持久化缓存，剩余键去重后一次交给 classifier.classify_batch()。
+        """
+        results: Dict[Tuple[str, str], Dict] = {}
+        misses: List[Tuple[str, str]] = []
+        with self._result_cache_lock:
+            for key in dict.fromkeys(keys):
+                cached_data = self._result_cache.get(key)
+                if cached_data is None:
+                    misses.append(key)
+                else:
+                    self._result_cache.move_to_end(key)
+                    results[key] = cached_data
+            self._result_cache_hits += len(keys) - len(misses)
+            self._result_cache_misses += len(misses)
+        
+        if misses:
+            fresh: Dict[Tuple[str, str], Dict] = {}
+            store = self.classification_store
+            if store is not None:
+                pending = []
+                for key in misses:
+                    stored = store.get(*key)
+                    if stored is None:
+                        pending.append(key)
+                    else:
+                        fresh[key] = _intern_result_strings(stored)
             else:
-                # 字典结果
-                cached_data = {
-                    'category': self._normalize_category_string(result.get('category', '未分类')),
-                    'subcategory': result.get('subcategory'),
-                    'confidence': result.get('confidence', 0.0),
-                    'alternatives': result.get('alternatives', []),
-                    'reasoning': result.get('reasoning', []),
-                    'method': result.get('method', 'unknown'),
-                    'processing_time': result.get('processing_time', 0.0),
-                    'facets': result.get('facets', {})
-                }
+                pending = misses
             
-            # 限制缓存大小
-            if len(self._classification_cache) < 10000:
-                self._classification_cache[cache_key] = cached_data
+            if pending:
+                for key, result in zip(pending, self.classifier.classify_batch(pending)):
+                    cached_data = self._build_result_data(result)
+                    fresh[key] = cached_data
+                    if store is not None:
+                        store.put(*key, cached_data)
             
-            # 构建结果
-            classified_bookmark = {
-                **bookmark,
-                **cached_data
+            categories_found = self.stats['categories_found']
+            with self._result_cache_lock:
+                for key, cached_data in fresh.items():
+                    # 更新分类统计（每个键只计一次；并发线程同时未命中时以先写入者为准）
+                    if key in self._result_cache:
+                        continue
+                    category = cached_data['category']
+                    categories_found[category] = categories_found.get(category, 0) + 1
+                    self._result_cache[key] = cached_data
+                while len(self._result_cache) > CLASSIFICATION_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+            results.update(fresh)
+        
+        return [results[key] for key in keys]
+    
+    def _build_result_data(self, result) -> Dict:
+        """将 ClassificationResult 转为写回书签的规范化字段（直接读取数据类字段）"""
+        return {
+            'category': self._normalize_category_string(result.category),
+            'subcategory': result.subcategory,
+            'confidence': result.confidence,
+            'alternatives': result.alternatives,
+            'reasoning': result.reasoning,
+            'method': result.method,
+            'processing_time': result.processing_time,
+            'facets': result.facets,
+        }
+    
+    def _classify_core(self, url: str, title: str) -> Dict:
+        """分类单个书签并规范化结果字段（进程池工作进程使用，不经过缓存）"""
+        return self._build_result_data(self.classifier.classify(url, title))
+    
+    def classification_cache_info(self) -> Dict:
+        """分类结果 LRU 缓存的命中统计（用于调整 CLASSIFICATION_CACHE_SIZE）"""
+        with self._result_cache_lock:
+            return {
+                'hits': self._result_cache_hits,
+                'misses': self._result_cache_misses,
+                'size': len(self._result_cache),
+                'maxsize': CLASSIFICATION_CACHE_SIZE,
             }
-            
-            # 更新分类统计
-            category = cached_data['category']
-            self.stats['categories_found'][category] = self.stats['categories_found'].get(category, 0) + 1
-            
-            return classified_bookmark
-            
-        except Exception as e:
-            self.logger.error(f"单个书签分类失败: {e}")
-            return None
+    
+    def clear_classification_cache(self):
+        """清空分类结果缓存（含持久化缓存中当前配置的结果）"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+            self._result_cache_hits = 0
+            self._result_cache_misses = 0
+        if self.classification_store is not None:
+            self.classification_store.clear()
     
     def _organize_bookmarks(self, classified_bookmarks: List[Dict]) -> Dict:
         """按 subject -> resource_type 两级组织（受控词表标准化）。"""
-        organized: Dict[str, Dict] = {}
-
-        for bookmark in classified_bookmarks:
+        # 先按 (subject, resource_type) 平铺分桶，每条书签只做一次字典查找，循环结束后再组装两级结构
+        buckets: Dict[Tuple[str, Optional[str]], List[Dict]] = defaultdict(list)
+
+        # 先按置信度列整体降序排序（稳定排序，同分保持原顺序），分组后各组内已有序，
+        # _sort_organized_structure 中的组内排序退化为线性检查
+        confidences = np.fromiter(
+            (bookmark.get('confidence', 0.0) or 0.0 for bookmark in classified_bookmarks),
+            dtype=np.float64, count=len(classified_bookmarks),
+        )
+        order = np.argsort(-confidences, kind='stable')
+
+        # (category, subcategory, resource_type 提示) 组合很少：本次调用内每种组合只解析一次
+        resolved: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[str, Optional[str]]] = {}
+
+        for idx in order.tolist():
+            bookmark = classified_bookmarks[idx]
             category = (bookmark.get('category') or '').strip()
             subcategory = (bookmark.get('subcategory') or '').strip() or None
-
-            # 从分类派生 subject / resource_type
-            derived_subject, derived_rt = self.standardizer.derive_from_category(
-                category, content_type=None
-            )
-
-            # 标准化 subject 与 resource_type
-            subject = derived_subject or self.standardizer.normalize_subject(category) or '其他'
-            # 优先使用规则引擎提供的 resource_type 分面提示
             facets = bookmark.get('facets') or {}
             facet_rt_hint = facets.get('resource_type_hint') if isinstance(facets, dict) else None
-            facet_rt_std = self.standardizer.normalize_resource_type(facet_rt_hint) if facet_rt_hint else None
-            resource_type = facet_rt_std or self.standardizer.normalize_resource_type(subcategory) or derived_rt
 
-            # 初始化 subject 节点
-            if subject not in organized:
-                organized[subject] = {'_items': [], '_subcategories': {}}
+            resolve_key = (category, subcategory, facet_rt_hint)
+            bucket_key = resolved.get(resolve_key)
+            if bucket_key is None:
+                # 从分类派生 subject / resource_type
+                derived_subject, derived_rt = self.standardizer.derive_from_category(
+                    category, content_type=None
+                )
+
+                # 标准化 subject 与 resource_type
+                subject = derived_subject or self.standardizer.normalize_subject(category) or '其他'
+                # 优先使用规则引擎提供的 resource_type 分面提示
+                facet_rt_std = self.standardizer.normalize_resource_type(facet_rt_hint) if facet_rt_hint else None
+                resource_type = facet_rt_std or self.standardizer.normalize_resource_type(subcategory) or derived_rt
+                bucket_key = resolved[resolve_key] = (subject, resource_type or None)
 
-            # 放入 resource_type 子类或直接归于 subject
+            buckets[bucket_key].append(bookmark)
+
+        # 放入 resource_type 子类或直接归于 subject
+        organized: Dict[str, Dict] = {}
+        for (subject, resource_type), items in buckets.items():
+            subject_node = organized.setdefault(subject, {'_items': [], '_subcategories': {}})
             if resource_type:
-                if resource_type not in organized[subject]['_subcategories']:
-                    organized[subject]['_subcategories'][resource_type] = {'_items': []}
-                organized[subject]['_subcategories'][resource_type]['_items'].append(bookmark)
+                subject_node['_subcategories'][resource_type] = {'_items': items}
             else:
-                organized[subject]['_items'].append(bookmark)
+                subject_node['_items'] = items
 
         return self._sort_organized_structure(organized)
 
@@ -574,7 +780,7 @@ class BookmarkProcessor:
 
             items = subject_data.get('_items', [])
             if isinstance(items, list):
-                items.sort(key=lambda x: x.get('confidence', 0.0), reverse=True)
+                items.sort(key=itemgetter('confidence'), reverse=True)
                 subject_data['_items'] = items
 
             subcategories = subject_data.get('_subcategories', {})
@@ -582,7 +788,7 @@ class BookmarkProcessor:
                 for sub_data in subcategories.values():
                     sub_items = (sub_data or {}).get('_items', [])
                     if isinstance(sub_items, list):
-                        sub_items.sort(key=lambda x: x.get('confidence', 0.0), reverse=True)
+                        sub_items.sort(key=itemgetter('confidence'), reverse=True)
                         sub_data['_items'] = sub_items
 
                 ordered_subcats = sorted(
@@ -653,6 +859,8 @@ class BookmarkProcessor:
             self.logger.info(f"使用 {samples_added} 个样本进行训练...")
             if self.classifier.ml_classifier.train_model():
                 self.logger.info(f"模型训练完成。")
+                # 模型已更新，旧的分类结果不再可靠
+                self.clear_classification_cache()
             else:
                 self.logger.error("模型训练失败。")
         else:
@@ -692,4 +900,5 @@ class BookmarkProcessor:
             'processing_speed_bps': processed_bookmarks / max(processing_time, 0.001), # bookmarks per second
             'success_rate_percent': (processed_bookmarks / max(total_bookmarks, 1)) * 100,
             'llm_organizer_stats': llm_stats,
+            'classification_cache': self.classification_cache_info(),
         }
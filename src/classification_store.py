@@ -0,0 +1,107 @@
+"""
+Classification Store - 分类结果持久化缓存
+
+职责：
+- 以 SQLite 表保存 (url, title) 的规范化分类结果，跨进程运行复用
+- 结果按配置指纹隔离：配置、ML 开关或依赖文件（模型、学习数据、词表）变化后自动失效，无需手动清理
+- 写入先进入内存队列，由调用方在一批分类结束后统一 flush（单事务 executemany）
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .json_io import encode_json, decode_json
+
+
+def file_signatures(paths: Iterable[str]) -> List[Tuple[str, int, int]]:
+    """依赖文件的 (路径, 大小, 修改时间 ns) 签名；目录展开为其中的文件，不存在的路径记为 (路径, -1, -1)"""
+    signatures: List[Tuple[str, int, int]] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files = sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if os.path.isfile(os.path.join(path, name))
+            )
+        else:
+            files = [path]
+        for file_path in files:
+            try:
+                st = os.stat(file_path)
+                signatures.append((file_path, st.st_size, st.st_mtime_ns))
+            except OSError:
+                signatures.append((file_path, -1, -1))
+    return signatures
+
+
+def config_fingerprint(config: Dict, use_ml: bool, dependency_files: Iterable[str] = ()) -> str:
+    """计算影响分类结果的配置指纹（含依赖文件签名，模型重新训练或词表修改后指纹随之变化）"""
+    payload = encode_json(
+        {'config': config, 'use_ml': use_ml, 'files': file_signatures(dependency_files)},
+        indent=False,
+    )
+    return hashlib.sha1(payload).hexdigest()
+
+
+class ClassificationStore:
+    """按 (配置指纹, url, title) 持久化分类结果的 SQLite 存储（线程安全）"""
+
+    def __init__(self, path: str, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, str, str, bytes]] = []
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS classification_cache ('
+            'fingerprint TEXT NOT NULL, url TEXT NOT NULL, title TEXT NOT NULL, data BLOB NOT NULL, '
+            'PRIMARY KEY (fingerprint, url, title)) WITHOUT ROWID'
+        )
+
+    def get(self, url: str, title: str) -> Optional[Dict[str, Any]]:
+        """查询已缓存的分类结果，未命中返回 None"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM classification_cache WHERE fingerprint = ? AND url = ? AND title = ?',
+                (self.fingerprint, url, title)
+            ).fetchone()
+        return decode_json(row[0]) if row else None
+
+    def put(self, url: str, title: str, data: Dict[str, Any]):
+        """登记待写入的分类结果（flush 时落盘）"""
+        payload = encode_json(data, indent=False)
+        with self._lock:
+            self._pending.append((self.fingerprint, url, title, payload))
+
+    def flush(self):
+        """将待写入结果在单个事务内批量写入"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            with self._conn:
+                self._conn.execute('BEGIN')
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO classification_cache (fingerprint, url, title, data) VALUES (?, ?, ?, ?)',
+                    pending
+                )
+
+    def clear(self):
+        """删除当前配置指纹下的全部缓存结果"""
+        with self._lock:
+            self._pending.clear()
+            self._conn.execute('DELETE FROM classification_cache WHERE fingerprint = ?', (self.fingerprint,))
+
+    def close(self):
+        """写入剩余结果并关闭连接"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -70,8 +70,15 @@ class CLIInterface:
         except Exception as e:
             self._error(f"程序执行出错: {e}")
         finally:
+            self._close_processor()
             self._info("感谢使用AI智能书签分类系统!")
     
+    def _close_processor(self):
+        """释放当前处理器持有的常驻线程池与缓存连接"""
+        if self.processor is not None:
+            self.processor.close()
+            self.processor = None
+    
     def _print_welcome(self):
         """打印欢迎信息"""
         welcome_text = """
@@ -141,7 +148,8 @@ class CLIInterface:
         train_models = self._confirm("是否训练模型?", default=False) if use_ml else False
         workers = self._get_worker_count()
         
-        # 初始化处理器
+        # 初始化处理器（替换前先释放旧处理器的线程池）
+        self._close_processor()
         self.processor = BookmarkProcessor(
             max_workers=workers,
             use_ml=use_ml
@@ -722,8 +730,7 @@ class CLIInterface:
         cleared = []
         if self.processor is not None:
             try:
-                self.processor._classification_cache.clear()
-                self.processor._url_validation_cache.clear()
+                self.processor.clear_classification_cache()
                 cleared.append('处理器缓存')
             except Exception:
                 pass
@@ -890,7 +897,7 @@ class CLIInterface:
             self._error(f"写入配置失败: {e}")
     
     def _reload_config(self):
-        self.processor = None
+        self._close_processor()
         self.classifier = None
         self._success("配置已重载（下次操作将重新加载配置）")
     
@@ -21,6 +21,9 @@ DEFAULT_PREFIX_EMOJIS = (
 # 注意：使用非捕获分组，允许出现多个连续 emoji + 空格
 _PREFIX_RE = re.compile(rf'^(?:[{"".join(DEFAULT_PREFIX_EMOJIS)}]\s*)+')
 
+# 默认 emoji 的首字符集合：标题首字符不在其中时正则必然不匹配，可跳过 sub
+_PREFIX_CHARS = frozenset("".join(DEFAULT_PREFIX_EMOJIS))
+
 
 def clean_title(title: Optional[str], extra_prefix_emojis: Optional[Iterable[str]] = None) -> str:
     """移除标题开头的指示类 emoji 前缀并去除两端空白。
@@ -43,4 +46,7 @@ def clean_title(title: Optional[str], extra_prefix_emojis: Optional[Iterable[str
         pattern = re.compile(rf'^(?:[{safe}]\s*)+')
         return pattern.sub("", text).strip()
 
+    # 绝大多数标题不带指示 emoji：先做一次集合查找，省去正则调用
+    if text[0] not in _PREFIX_CHARS:
+        return text.strip()
     return _PREFIX_RE.sub("", text).strip()
@@ -17,6 +17,7 @@ from typing import Dict, List, Tuple, Optional, Set
 from urllib.parse import urlparse
 from collections import defaultdict, Counter
 from functools import lru_cache
+from operator import itemgetter
 import hashlib
 import logging
 from dataclasses import dataclass, field
@@ -428,7 +429,7 @@ class EnhancedClassifier:
                 # 备选分类
                 alternatives = [(cat, score) for cat, score in normalized_scores.items() 
                               if cat != best_category]
-                alternatives.sort(key=lambda x: x[1], reverse=True)
+                alternatives.sort(key=itemgetter(1), reverse=True)
                 
                 result = ClassificationResult(
                     category=best_category,
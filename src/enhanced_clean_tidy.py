@@ -13,25 +13,109 @@ Enhanced Bookmark Processing System - 增强版书签处理系统
 import os
 import sys
 import argparse
-import json
 import glob
 import time
 from typing import Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from threading import Lock
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
 import hashlib
-from bs4 import BeautifulSoup
+import heapq
 import html
 import re
+from urllib.parse import urlparse, urlunparse
 from emoji_cleaner import clean_title as clean_emoji_title
 
 # 添加项目路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from enhanced_classifier import EnhancedClassifier, ClassificationResult
+from bookmark_parser import VALID_URL_PREFIXES, iter_bookmark_links
+from json_io import dump_json
+
+# 输出文件写缓冲大小（逐行写入时减少系统调用）
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# 进程池工作进程内的分类器（由 initializer 每进程构建一次）
+_worker_classifier: Optional[EnhancedClassifier] = None
+
+def _init_classifier_worker(config_file: str):
+    """进程池初始化：每个工作进程只加载一次配置与学习数据"""
+    global _worker_classifier
+    _worker_classifier = EnhancedClassifier(config_file)
+    _worker_classifier.load_learning_data()
+
+def _classify_in_worker(item: Tuple[str, str, Optional[str]]) -> Optional[ClassificationResult]:
+    """在工作进程中分类单个书签，失败返回 None"""
+    url, title, source_file = item
+    try:
+        return _worker_classifier.classify(url, title, context={'source_file': source_file})
+    except Exception:
+        return None
+
+# 去重时忽略的跟踪参数
+TRACKING_PARAMS = frozenset({'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+                             'fbclid', 'gclid', 'ref', 'source', 'from'})
+
+def _filter_tracking_params(query: str) -> str:
+    """移除跟踪参数（不含 '=' 的参数一并丢弃）"""
+    query_parts = []
+    for param in query.split('&'):
+        if '=' in param:
+            key = param.split('=', 1)[0]
+            if key not in TRACKING_PARAMS:
+                query_parts.append(param)
+    return '&'.join(query_parts)
+
+@lru_cache(maxsize=131072)
+def _normalize_url(url: str) -> str:
+    """标准化URL：小写、去 www.、去尾部斜杠、去跟踪参数与片段
+
+    http(s) URL 走手写切分的快速路径（与 urlparse/urlunparse 结果一致），
+    其余情况回退到 urlparse。
+    """
+    url = url.lower()
+    try:
+        if url.startswith(('http://', 'https://')):
+            scheme, _, rest = url.partition('://')
+            rest = rest.split('#', 1)[0]
+            rest, _, query = rest.partition('?')
+            slash = rest.find('/')
+            if slash < 0:
+                netloc, path = rest, ''
+            else:
+                netloc, path = rest[:slash], rest[slash:]
+            netloc = netloc.replace('www.', '')
+            if netloc and '[' not in netloc and ']' not in netloc and not any(c in url for c in '\t\r\n'):
+                # urlparse 会把最后一段路径中 ';' 之后的部分作为 params 丢弃
+                semi = path.find(';', path.rfind('/'))
+                if semi >= 0:
+                    path = path[:semi]
+                normalized = f"{scheme}://{netloc}{path.rstrip('/')}"
+                query = _filter_tracking_params(query) if query else ''
+                return f"{normalized}?{query}" if query else normalized
+        
+        parsed = urlparse(url)
+        
+        # 移除www前缀
+        netloc = parsed.netloc.replace('www.', '')
+        
+        # 移除尾部斜杠
+        path = parsed.path.rstrip('/')
+        
+        # 忽略常见的跟踪参数
+        query = parsed.query
+        if query:
+            query = _filter_tracking_params(query)
+        
+        return urlunparse((parsed.scheme, netloc, path, '', query, ''))
+        
+    except Exception:
+        return url
 
 @dataclass
 class ProcessingStats:
@@ -53,9 +137,11 @@ class ProcessingStats:
 class EnhancedBookmarkProcessor:
     """增强版书签处理器"""
     
-    def __init__(self, config_file: str = "config.json", max_workers: int = 4):
+    def __init__(self, config_file: str = "config.json", max_workers: int = 4, use_processes: bool = False):
         self.config_file = config_file
         self.max_workers = max_workers
+        # 使用进程池分类（CPU 密集场景），各进程独立维护分类器缓存与学习状态
+        self.use_processes = use_processes
         self.classifier = EnhancedClassifier(config_file)
         
         # 处理状态
@@ -110,24 +196,19 @@ class EnhancedBookmarkProcessor:
         
         for file_path in input_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                soup = BeautifulSoup(content, 'lxml')
-                links = soup.find_all('a')
-                
                 file_bookmarks = []
-                for link in links:
-                    url = link.get('href', '').strip()
-                    title = (link.string or link.get_text() or url).strip()
+                # 非 http(s) 链接在解析回调内即被过滤
+                for link in iter_bookmark_links(file_path, href_prefixes=VALID_URL_PREFIXES):
+                    url = link.href.strip()
+                    title = (link.text or url).strip()
                     
-                    if url and title and self._is_valid_url(url):
+                    if title:
                         file_bookmarks.append({
                             'url': url,
                             'title': title,
                             'source_file': file_path,
-                            'add_date': link.get('add_date', ''),
-                            'last_modified': link.get('last_modified', '')
+                            'add_date': link.add_date,
+                            'last_modified': link.last_modified
                         })
                 
                 all_bookmarks.extend(file_bookmarks)
@@ -139,21 +220,7 @@ class EnhancedBookmarkProcessor:
         self.logger.info(f"总共加载了 {len(all_bookmarks)} 个书签")
         return all_bookmarks
     
-    def _is_valid_url(self, url: str) -> bool:
-        """验证URL是否有效"""
-        if not url:
-            return False
-        
-        # 过滤掉无效的URL
-        invalid_prefixes = ['javascript:', 'data:', 'chrome:', 'about:', 'file:', 'mailto:']
-        for prefix in invalid_prefixes:
-            if url.lower().startswith(prefix):
-                return False
-        
-        # 检查是否为有效的HTTP/HTTPS URL
-        return url.startswith(('http://', 'https://'))
-    
-    def _generate_content_hash(self, url: str, title: str) -> str:
+    def _generate_content_hash(self, url: str, title: str) -> bytes:
         """生成内容哈希用于去重"""
         # 标准化URL
         normalized_url = self._normalize_url(url)
@@ -161,39 +228,13 @@ class EnhancedBookmarkProcessor:
         # 标准化标题
         normalized_title = self._normalize_title(title)
         
-        # 生成哈希
-        content = f"{normalized_url}::{normalized_title}"
-        return hashlib.md5(content.encode()).hexdigest()
+        # 生成哈希：128 位 blake2b 原始摘要（bytes 49 B，十六进制字符串需 81 B），比 md5 + hexdigest 更快
+        content = f"{normalized_url}\0{normalized_title}"
+        return hashlib.blake2b(content.encode(), digest_size=16).digest()
     
     def _normalize_url(self, url: str) -> str:
         """标准化URL"""
-        try:
-            from urllib.parse import urlparse, urlunparse
-            parsed = urlparse(url.lower())
-            
-            # 移除www前缀
-            netloc = parsed.netloc.replace('www.', '')
-            
-            # 移除尾部斜杠
-            path = parsed.path.rstrip('/')
-            
-            # 忽略常见的跟踪参数
-            query = parsed.query
-            if query:
-                tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-                                 'fbclid', 'gclid', 'ref', 'source', 'from']
-                query_parts = []
-                for param in query.split('&'):
-                    if '=' in param:
-                        key, value = param.split('=', 1)
-                        if key not in tracking_params:
-                            query_parts.append(param)
-                query = '&'.join(query_parts)
-            
-            return urlunparse((parsed.scheme, netloc, path, '', query, ''))
-            
-        except Exception:
-            return url.lower()
+        return _normalize_url(url)
     
     def _normalize_title(self, title: str) -> str:
         """标准化标题"""
@@ -213,15 +254,19 @@ class EnhancedBookmarkProcessor:
         for old, new in cleaning_rules.get("replacements", {}).items():
             title = title.replace(old, new)
         
-        # 前缀清理
-        for prefix in cleaning_rules.get("prefixes", []):
-            if title.startswith(prefix):
-                title = title[len(prefix):].strip()
+        # 前缀清理：先以元组做一次 C 层前缀匹配，绝大多数标题无需逐条循环
+        prefixes = tuple(cleaning_rules.get("prefixes", ()))
+        if prefixes and title.startswith(prefixes):
+            for prefix in prefixes:
+                if title.startswith(prefix):
+                    title = title[len(prefix):].strip()
         
-        # 后缀清理
-        for suffix in cleaning_rules.get("suffixes", []):
-            if title.endswith(suffix):
-                title = title[:-len(suffix)].strip()
+        # 后缀清理（同上）
+        suffixes = tuple(cleaning_rules.get("suffixes", ()))
+        if suffixes and title.endswith(suffixes):
+            for suffix in suffixes:
+                if title.endswith(suffix):
+                    title = title[:-len(suffix)].strip()
         
         return title.strip()
     
@@ -236,43 +281,14 @@ class EnhancedBookmarkProcessor:
         return False
     
     def _process_single_bookmark(self, bookmark: Dict) -> Optional[Dict]:
-        """处理单个书签"""
+        """处理单个书签（去重已在调度前串行完成）"""
         try:
-            # 检查重复
-            if self._is_duplicate(bookmark):
-                with self.stats_lock:
-                    self.stats.duplicates_removed += 1
-                return None
-            
-            # 分类
             result = self.classifier.classify(
                 bookmark['url'], 
                 bookmark['title'],
                 context={'source_file': bookmark.get('source_file')}
             )
-            
-            # 构建结果
-            processed_bookmark = {
-                'url': bookmark['url'],
-                'title': bookmark['title'],
-                'category': result.category,
-                'confidence': result.confidence,
-                'alternatives': result.alternative_categories,
-                'reasoning': result.reasoning,
-                'features_used': result.features_used,
-                'processing_time': result.processing_time,
-                'source_file': bookmark.get('source_file', ''),
-                'add_date': bookmark.get('add_date', ''),
-                'last_modified': bookmark.get('last_modified', '')
-            }
-            
-            # 更新统计
-            with self.stats_lock:
-                self.stats.processed_bookmarks += 1
-                self.stats.categories_found[result.category] = \
-                    self.stats.categories_found.get(result.category, 0) + 1
-            
-            return processed_bookmark
+            return self._build_processed_bookmark(bookmark, result)
             
         except Exception as e:
             self.logger.error(f"处理书签失败 {bookmark.get('url', 'unknown')}: {e}")
@@ -280,8 +296,93 @@ class EnhancedBookmarkProcessor:
                 self.stats.errors_count += 1
             return None
     
+    def _build_processed_bookmark(self, bookmark: Dict, result: ClassificationResult) -> Dict:
+        """根据分类结果构建输出书签并更新统计"""
+        processed_bookmark = {
+            'url': bookmark['url'],
+            'title': bookmark['title'],
+            'category': result.category,
+            'confidence': result.confidence,
+            'alternatives': result.alternative_categories,
+            'reasoning': result.reasoning,
+            'features_used': result.features_used,
+            'processing_time': result.processing_time,
+            'source_file': bookmark.get('source_file', ''),
+            'add_date': bookmark.get('add_date', ''),
+            'last_modified': bookmark.get('last_modified', '')
+        }
+        
+        # 更新统计
+        with self.stats_lock:
+            self.stats.processed_bookmarks += 1
+            self.stats.categories_found[result.category] = \
+                self.stats.categories_found.get(result.category, 0) + 1
+        
+        return processed_bookmark
+    
+    def _remove_duplicates(self, bookmarks: List[Dict]) -> List[Dict]:
+        """串行去重：结果确定，且避免并发读写 duplicate_hashes"""
+        unique_bookmarks = []
+        for bookmark in bookmarks:
+            if self._is_duplicate(bookmark):
+                self.stats.duplicates_removed += 1
+            else:
+                unique_bookmarks.append(bookmark)
+        return unique_bookmarks
+    
+    def _log_progress(self):
+        progress = (self.stats.processed_bookmarks + self.stats.duplicates_removed + self.stats.errors_count) / self.stats.total_bookmarks * 100
+        self.logger.info(f"处理进度: {progress:.1f}% ({self.stats.processed_bookmarks} 处理完成, {self.stats.duplicates_removed} 重复, {self.stats.errors_count} 错误)")
+    
+    def _classify_with_threads(self, bookmarks: List[Dict], show_progress: bool) -> List[Dict]:
+        """线程池并行分类（按块提交，结果保持输入顺序）"""
+        processed_bookmarks = []
+        # ThreadPoolExecutor.map 不支持 chunksize，手动切块以减少 Future 数量
+        chunksize = max(1, min(32, len(bookmarks) // (self.max_workers * 4) or 1))
+        chunks = [bookmarks[i:i + chunksize] for i in range(0, len(bookmarks), chunksize)]
+        
+        # _process_single_bookmark 内部已捕获异常并计数，map 迭代不会中途抛出
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk_results in executor.map(self._process_bookmark_chunk, chunks):
+                for result in chunk_results:
+                    if result:
+                        processed_bookmarks.append(result)
+                    
+                    # 显示进度
+                    if show_progress and self.stats.processed_bookmarks % 50 == 0:
+                        self._log_progress()
+        
+        return processed_bookmarks
+    
+    def _process_bookmark_chunk(self, bookmarks: List[Dict]) -> List[Optional[Dict]]:
+        """在单个工作线程内依次处理一块书签"""
+        return [self._process_single_bookmark(bookmark) for bookmark in bookmarks]
+    
+    def _classify_with_processes(self, bookmarks: List[Dict], show_progress: bool) -> List[Dict]:
+        """进程池并行分类（按块分发，结果保持输入顺序）"""
+        processed_bookmarks = []
+        items = [(b['url'], b['title'], b.get('source_file')) for b in bookmarks]
+        chunksize = max(1, min(512, len(items) // (self.max_workers * 4) or 1))
+        
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_classifier_worker,
+            initargs=(self.config_file,)
+        ) as executor:
+            for bookmark, result in zip(bookmarks, executor.map(_classify_in_worker, items, chunksize=chunksize)):
+                if result is None:
+                    self.logger.error(f"处理书签失败 {bookmark.get('url', 'unknown')}")
+                    self.stats.errors_count += 1
+                    continue
+                processed_bookmarks.append(self._build_processed_bookmark(bookmark, result))
+                
+                if show_progress and self.stats.processed_bookmarks % 50 == 0:
+                    self._log_progress()
+        
+        return processed_bookmarks
+    
     def process_bookmarks(self, input_files: List[str], show_progress: bool = True) -> List[Dict]:
-        """主处理方法 - 支持并行处理"""
+        """主处理方法 - 串行去重 + 并行分类"""
         self.logger.info("开始处理书签...")
         self.stats.start_time = datetime.now()
         
@@ -293,32 +394,14 @@ class EnhancedBookmarkProcessor:
             self.logger.error("没有找到有效的书签")
             return []
         
-        # 并行处理
-        processed_bookmarks = []
+        # 去重
+        unique_bookmarks = self._remove_duplicates(all_bookmarks)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 提交任务
-            future_to_bookmark = {
-                executor.submit(self._process_single_bookmark, bookmark): bookmark
-                for bookmark in all_bookmarks
-            }
-            
-            # 处理结果
-            for future in as_completed(future_to_bookmark):
-                try:
-                    result = future.result()
-                    if result:
-                        processed_bookmarks.append(result)
-                    
-                    # 显示进度
-                    if show_progress and self.stats.processed_bookmarks % 50 == 0:
-                        progress = (self.stats.processed_bookmarks + self.stats.duplicates_removed + self.stats.errors_count) / self.stats.total_bookmarks * 100
-                        self.logger.info(f"处理进度: {progress:.1f}% ({self.stats.processed_bookmarks} 处理完成, {self.stats.duplicates_removed} 重复, {self.stats.errors_count} 错误)")
-                        
-                except Exception as e:
-                    self.logger.error(f"获取处理结果时出错: {e}")
-                    with self.stats_lock:
-                        self.stats.errors_count += 1
+        # 并行分类
+        if self.use_processes:
+            processed_bookmarks = self._classify_with_processes(unique_bookmarks, show_progress)
+        else:
+            processed_bookmarks = self._classify_with_threads(unique_bookmarks, show_progress)
         
         # 完成统计
         self.stats.end_time = datetime.now()
@@ -367,179 +450,160 @@ class EnhancedBookmarkProcessor:
                     organized[category] = {'_items': []}
                 organized[category]['_items'].append(bookmark)
         
-        # 排序书签（按置信度降序）
-        def sort_items(node):
-            if isinstance(node, dict):
-                if '_items' in node:
-                    node['_items'].sort(key=lambda x: x['confidence'], reverse=True)
-                for key, value in node.items():
-                    if key != '_items':
-                        sort_items(value)
+        # 一次性排好整棵树：子分类按名称排序、书签按置信度降序（_items 置于末尾），
+        # 输出函数按字典顺序遍历即可，无需在每层递归中重复排序
+        def sort_node(node: Dict) -> Dict:
+            ordered = {key: sort_node(node[key]) for key in sorted(k for k in node if k != '_items')}
+            if '_items' in node:
+                node['_items'].sort(key=itemgetter('confidence'), reverse=True)
+                ordered['_items'] = node['_items']
+            return ordered
         
-        sort_items(organized)
+        # 顶层：先按配置的分类顺序，其余分类按名称排序
+        top_keys = [c for c in dict.fromkeys(category_order) if c in organized]
+        top_keys += sorted(k for k in organized if k not in category_order)
         
-        return organized
+        return {key: sort_node(organized[key]) for key in top_keys}
     
     def generate_html_output(self, organized_bookmarks: Dict, output_file: str):
-        """生成增强版HTML输出"""
+        """生成增强版HTML输出（边遍历分类边写入文件）"""
         self.logger.info(f"生成HTML输出: {output_file}")
         
-        lines = [
-            "<!DOCTYPE NETSCAPE-Bookmark-file-1>",
-            "<META HTTP-EQUIV=\"Content-Type\" CONTENT=\"text/html; charset=UTF-8\">",
-            "<TITLE>Enhanced Bookmark Classification</TITLE>",
-            "<H1>🚀 智能书签分类系统</H1>",
-            f"<P>生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</P>",
-            f"<P>总计: {self.stats.processed_bookmarks} 个书签, 平均置信度: {self.stats.avg_confidence:.3f}</P>",
-            "<DL><p>"
-        ]
-        
-        def write_category(name: str, data: Dict, indent: int = 1):
-            ind = "    " * indent
-            timestamp = str(int(time.time()))
-            
-            lines.append(f"{ind}<DT><H3 ADD_DATE=\"{timestamp}\">{html.escape(name)}</H3>")
-            lines.append(f"{ind}<DL><p>")
-            
-            # 子分类
-            subcats = sorted([k for k in data.keys() if k != '_items'])
-            for subcat in subcats:
-                write_category(subcat, data[subcat], indent + 1)
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            write = f.write
+            write(
+                "<!DOCTYPE NETSCAPE-Bookmark-file-1>\n"
+                "<META HTTP-EQUIV=\"Content-Type\" CONTENT=\"text/html; charset=UTF-8\">\n"
+                "<TITLE>Enhanced Bookmark Classification</TITLE>\n"
+                "<H1>🚀 智能书签分类系统</H1>\n"
+                f"<P>生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</P>\n"
+                f"<P>总计: {self.stats.processed_bookmarks} 个书签, 平均置信度: {self.stats.avg_confidence:.3f}</P>\n"
+                "<DL><p>\n"
+            )
+            show_conf = self.classifier.config.get("show_confidence_indicator", False)
             
-            # 书签项目
-            if '_items' in data:
-                show_conf = self.classifier.config.get("show_confidence_indicator", False)
-                for item in data['_items']:
-                    confidence = item['confidence']
-                    # 清理已有 emoji 前缀（统一模块）
-                    clean_title = clean_emoji_title(item['title'])
-                    
-                    # 置信度指示器
-                    if show_conf:
-                        if confidence >= 0.9:
-                            indicator = "🔥"
-                        elif confidence >= 0.7:
-                            indicator = "📌"
-                        elif confidence >= 0.5:
-                            indicator = "⭐"
+            def write_category(name: str, data: Dict, indent: int = 1):
+                ind = "    " * indent
+                timestamp = str(int(time.time()))
+                
+                write(f"{ind}<DT><H3 ADD_DATE=\"{timestamp}\">{html.escape(name)}</H3>\n")
+                write(f"{ind}<DL><p>\n")
+                
+                # 子分类（organize_bookmarks 已排序）
+                for subcat, subdata in data.items():
+                    if subcat != '_items':
+                        write_category(subcat, subdata, indent + 1)
+                
+                # 书签项目
+                if '_items' in data:
+                    for item in data['_items']:
+                        confidence = item['confidence']
+                        # 清理已有 emoji 前缀（统一模块）
+                        clean_title = clean_emoji_title(item['title'])
+                        
+                        # 置信度指示器
+                        if show_conf:
+                            if confidence >= 0.9:
+                                indicator = "🔥"
+                            elif confidence >= 0.7:
+                                indicator = "📌"
+                            elif confidence >= 0.5:
+                                indicator = "⭐"
+                            else:
+                                indicator = "❓"
+                            title_final = f"{indicator} {html.escape(clean_title)}"
                         else:
-                            indicator = "❓"
-                        title_final = f"{indicator} {html.escape(clean_title)}"
-                    else:
-                        title_final = html.escape(clean_title)
-                    
-                    url_escaped = html.escape(item['url'], quote=True)
-                    lines.append(f"{ind}    <DT><A HREF=\"{url_escaped}\" ADD_DATE=\"{timestamp}\">{title_final}</A>")
+                            title_final = html.escape(clean_title)
+                        
+                        url_escaped = html.escape(item['url'], quote=True)
+                        write(f"{ind}    <DT><A HREF=\"{url_escaped}\" ADD_DATE=\"{timestamp}\">{title_final}</A>\n")
+                
+                write(f"{ind}</DL><p>\n")
             
-            lines.append(f"{ind}</DL><p>")
-        
-        # 按配置的顺序处理分类
-        category_order = self.classifier.config.get("category_order", [])
-        
-        for category in category_order:
-            if category in organized_bookmarks:
-                write_category(category, organized_bookmarks[category])
-        
-        # 处理其他分类
-        for category in sorted(organized_bookmarks.keys()):
-            if category not in category_order:
-                write_category(category, organized_bookmarks[category])
-        
-        lines.append("</DL><p>")
-        
-        # 写入文件
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+            # 分类顺序已由 organize_bookmarks 确定
+            for category, data in organized_bookmarks.items():
+                write_category(category, data)
+            
+            write("</DL><p>")
         
         self.logger.info(f"HTML文件已保存: {output_file}")
     
     def generate_markdown_output(self, organized_bookmarks: Dict, output_file: str):
-        """生成增强版Markdown输出"""
+        """生成增强版Markdown输出（边遍历分类边写入文件）"""
         self.logger.info(f"生成Markdown输出: {output_file}")
         
-        lines = [
-            "# 🚀 智能书签分类报告",
-            "",
-            f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ",
-            f"**处理统计**: {self.stats.processed_bookmarks} 个书签, 平均置信度: {self.stats.avg_confidence:.3f}  ",
-            f"**处理速度**: {self.stats.processing_speed:.2f} 书签/秒  ",
-            f"**去除重复**: {self.stats.duplicates_removed} 个",
-            "",
-            "## 📊 分类统计",
-            ""
-        ]
-        
-        # 分类统计
-        for category, count in sorted(self.stats.categories_found.items(), key=lambda x: x[1], reverse=True):
-            lines.append(f"- **{category}**: {count} 个")
-        
-        lines.extend(["", "---", ""])
-        
-        def write_category(name: str, data: Dict, level: int = 2):
-            prefix = "#" * min(level, 6)
-            lines.append(f"{prefix} {name}")
-            lines.append("")
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            write = f.write
+            write(
+                "# 🚀 智能书签分类报告\n"
+                "\n"
+                f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n"
+                f"**处理统计**: {self.stats.processed_bookmarks} 个书签, 平均置信度: {self.stats.avg_confidence:.3f}  \n"
+                f"**处理速度**: {self.stats.processing_speed:.2f} 书签/秒  \n"
+                f"**去除重复**: {self.stats.duplicates_removed} 个\n"
+                "\n"
+                "## 📊 分类统计\n"
+                "\n"
+            )
             
-            # 子分类
-            subcats = sorted([k for k in data.keys() if k != '_items'])
-            for subcat in subcats:
-                write_category(subcat, data[subcat], level + 1)
+            # 分类统计
+            for category, count in sorted(self.stats.categories_found.items(), key=lambda x: x[1], reverse=True):
+                write(f"- **{category}**: {count} 个\n")
             
-            # 书签项目
-            if '_items' in data:
-                show_conf = self.classifier.config.get("show_confidence_indicator", False)
-                for item in data['_items']:
-                    confidence = item['confidence']
-                    # 清理标题中的 emoji 前缀（统一模块）
-                    clean_title = clean_emoji_title(item['title'])
-                    
-                    # 置信度指示器（受配置开关控制）
-                    if show_conf:
-                        if confidence >= 0.9:
-                            indicator = "🔥"
-                        elif confidence >= 0.7:
-                            indicator = "📌"
-                        elif confidence >= 0.5:
-                            indicator = "⭐"
+            write("\n---\n\n")
+            show_conf = self.classifier.config.get("show_confidence_indicator", False)
+            
+            def write_category(name: str, data: Dict, level: int = 2):
+                prefix = "#" * min(level, 6)
+                write(f"{prefix} {name}\n\n")
+                
+                # 子分类（organize_bookmarks 已排序）
+                for subcat, subdata in data.items():
+                    if subcat != '_items':
+                        write_category(subcat, subdata, level + 1)
+                
+                # 书签项目
+                if '_items' in data:
+                    for item in data['_items']:
+                        confidence = item['confidence']
+                        # 清理标题中的 emoji 前缀（统一模块）
+                        clean_title = clean_emoji_title(item['title'])
+                        
+                        # 置信度指示器（受配置开关控制）
+                        if show_conf:
+                            if confidence >= 0.9:
+                                indicator = "🔥"
+                            elif confidence >= 0.7:
+                                indicator = "📌"
+                            elif confidence >= 0.5:
+                                indicator = "⭐"
+                            else:
+                                indicator = "❓"
+                            prefix_emoji = f"{indicator} "
                         else:
-                            indicator = "❓"
-                        prefix_emoji = f"{indicator} "
-                    else:
-                        prefix_emoji = ""
+                            prefix_emoji = ""
+                        
+                        write(f"- {prefix_emoji}[{clean_title}]({item['url']}) *({confidence:.3f})*\n")
                     
-                    lines.append(f"- {prefix_emoji}[{clean_title}]({item['url']}) *({confidence:.3f})*")
-                
-                lines.append("")
-        
-        # 按顺序处理分类
-        category_order = self.classifier.config.get("category_order", [])
-        
-        for category in category_order:
-            if category in organized_bookmarks:
-                write_category(category, organized_bookmarks[category])
-        
-        for category in sorted(organized_bookmarks.keys()):
-            if category not in category_order:
-                write_category(category, organized_bookmarks[category])
-        
-        # 添加详细统计
-        lines.extend([
-            "## 📈 处理详情",
-            "",
-            f"- **总书签数**: {self.stats.total_bookmarks}",
-            f"- **成功处理**: {self.stats.processed_bookmarks}",
-            f"- **重复移除**: {self.stats.duplicates_removed}",
-            f"- **处理错误**: {self.stats.errors_count}",
-            f"- **处理时间**: {(self.stats.end_time - self.stats.start_time).total_seconds():.2f} 秒",
-            f"- **缓存命中**: {self.classifier.get_stats().get('cache_hits', 0)}",
-            ""
-        ])
-        
-        # 写入文件
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+                    write("\n")
+            
+            # 分类顺序已由 organize_bookmarks 确定
+            for category, data in organized_bookmarks.items():
+                write_category(category, data)
+            
+            # 添加详细统计
+            write(
+                "## 📈 处理详情\n"
+                "\n"
+                f"- **总书签数**: {self.stats.total_bookmarks}\n"
+                f"- **成功处理**: {self.stats.processed_bookmarks}\n"
+                f"- **重复移除**: {self.stats.duplicates_removed}\n"
+                f"- **处理错误**: {self.stats.errors_count}\n"
+                f"- **处理时间**: {(self.stats.end_time - self.stats.start_time).total_seconds():.2f} 秒\n"
+                f"- **缓存命中**: {self.classifier.get_stats().get('cache_hits', 0)}\n"
+            )
         
         self.logger.info(f"Markdown文件已保存: {output_file}")
     
@@ -579,8 +643,7 @@ class EnhancedBookmarkProcessor:
         }
         
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        dump_json(report, output_file)
         
         self.logger.info(f"JSON报告已保存: {output_file}")
     
@@ -602,6 +665,7 @@ def main():
     parser.add_argument('--md-output', default='bookmarks_enhanced.md', help='Markdown输出文件名')
     parser.add_argument('--json-output', default='bookmarks_report.json', help='JSON报告文件名')
     parser.add_argument('--workers', type=int, default=4, help='并行处理线程数')
+    parser.add_argument('--processes', action='store_true', help='使用多进程并行分类（CPU 密集场景）')
     parser.add_argument('--no-progress', action='store_true', help='不显示处理进度')
     parser.add_argument('--save-learning', action='store_true', help='保存学习数据')
     
@@ -623,7 +687,7 @@ def main():
     print(f"⚡ 并行线程数: {args.workers}")
     
     # 初始化处理器
-    processor = EnhancedBookmarkProcessor(args.config, args.workers)
+    processor = EnhancedBookmarkProcessor(args.config, args.workers, use_processes=args.processes)
     
     try:
         # 处理书签
@@ -667,7 +731,7 @@ def main():
         
         # 显示分类统计
         print(f"\n📊 分类分布:")
-        for category, count in sorted(stats.categories_found.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for category, count in heapq.nlargest(10, stats.categories_found.items(), key=itemgetter(1)):
             print(f"  - {category}: {count} 个")
         
     except KeyboardInterrupt:
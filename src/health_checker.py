@@ -37,7 +37,7 @@ def run_health_check():
     
     # 2. 检查依赖包
     required_packages = [
-        ('beautifulsoup4', 'bs4'), ('lxml', 'lxml'), ('rich', 'rich'), 
+        ('lxml', 'lxml'), ('rich', 'rich'), 
         ('numpy', 'numpy'), ('scikit-learn', 'sklearn')
     ]
     
@@ -0,0 +1,56 @@
+"""
+JSON IO - 配置与模型文件的 JSON 读写
+
+职责：
+- 统一配置/模型文件的读取与写入（UTF-8、缩进 2、保留非 ASCII 字符）
+- 提供字节串编解码，供导出与分类结果缓存复用
+- 安装了 orjson 时使用其编解码（更快，直接处理 bytes），否则回退到标准库 json
+- orjson 无法序列化的数据（如超出 64 位的整数）自动回退到标准库
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_json(data: Any, indent: bool = True) -> bytes:
+    """编码为 UTF-8 JSON 字节串（保留中文；indent=False 时输出紧凑格式）"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_json(payload: bytes) -> Any:
+    """解码 UTF-8 JSON 字节串"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def load_json(path: str) -> Any:
+    """读取 JSON 文件"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: str) -> None:
+    """写入 JSON 文件（缩进 2，保留中文）"""
+    payload = encode_json(data)
+    with open(path, 'wb') as f:
+        f.write(payload)
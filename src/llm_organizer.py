@@ -22,6 +22,8 @@ from urllib.parse import urlparse
 
 import requests
 
+from .json_io import load_json
+
 _SYSTEM_PROMPT = (
     "You are an elite bookmark knowledge architect. "
     "Reorganize categories for maximum clarity and usefulness. "
@@ -419,7 +421,6 @@ class LLMBookmarkOrganizer:
 
     def _load_config(self) -> Dict[str, Any]:
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(self.config_path)
         except Exception:
             return {}
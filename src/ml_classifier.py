@@ -753,35 +753,45 @@ class MLClassifierWrapper:
     
     def classify(self, features, context=None) -> Optional[Dict]:
         """分类方法，返回结果字典"""
-        if not self.is_trained or not ML_AVAILABLE:
-            return None
+        return self.classify_batch([features])[0]
+    
+    def classify_batch(self, features_list: List) -> List[Optional[Dict]]:
+        """批量分类：整批特征堆叠后只调用一次模型预测"""
+        if not self.is_trained or not ML_AVAILABLE or not features_list:
+            return [None] * len(features_list)
         
         try:
             # 构建书签字典
-            bookmark = {
-                'url': features.url,
-                'title': features.title,
-                'domain': features.domain,
-                'path_segments': features.path_segments,
-                'content_type': features.content_type,
-                'language': features.language
-            }
-            
-            # 预测
-            category, confidence = self.ml_classifier.predict_single(bookmark)
-            
-            if confidence > 0.3:  # 最低置信度阈值
-                return {
-                    'category': category,
-                    'confidence': confidence,
-                    'method': 'machine_learning'
+            bookmarks = [
+                {
+                    'url': features.url,
+                    'title': features.title,
+                    'domain': features.domain,
+                    'path_segments': features.path_segments,
+                    'content_type': features.content_type,
+                    'language': features.language
                 }
+                for features in features_list
+            ]
             
-            return None
+            # 预测
+            predictions = self.ml_classifier.predict(bookmarks)
+            
+            results: List[Optional[Dict]] = []
+            for category, confidence in predictions:
+                if confidence > 0.3:  # 最低置信度阈值
+                    results.append({
+                        'category': category,
+                        'confidence': confidence,
+                        'method': 'machine_learning'
+                    })
+                else:
+                    results.append(None)
+            return results
             
         except Exception as e:
             logging.getLogger(__name__).error(f"ML分类失败: {e}")
-            return None
+            return [None] * len(features_list)
     
     def add_training_sample(self, features, category):
         """添加训练样本"""
@@ -16,11 +16,12 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
-import json
 from collections import defaultdict, deque
 import gc
 import tracemalloc
 
+from .json_io import dump_json
+
 @dataclass
 class PerformanceMetrics:
     """性能指标"""
@@ -240,8 +241,7 @@ class PerformanceMonitor:
         }
         
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        dump_json(report, filepath)
         
         self.logger.info(f"性能报告已保存: {filepath}")
     
@@ -9,7 +9,6 @@ import re
 import math
 from collections import Counter
 from typing import Dict, List, Optional, Set
-from urllib.parse import urlparse
 
 try:
     from .performance_optimizer import PerformanceMonitor as _OPTIMIZED_PERFORMANCE_MONITOR
@@ -78,11 +77,19 @@ class SemanticAnalyzer:
             r'wikipedia\.org': '学习/教育',
             r'docs\.|documentation': '学习/教育'
         }
+        # 预编译域名模式、预先小写各分类关键词，逐条书签不再重复编译与构建列表
+        self._compiled_domain_patterns = [
+            (re.compile(pattern, re.IGNORECASE), category)
+            for pattern, category in self.domain_patterns.items()
+        ]
+        self._category_keyword_sets = {
+            category: frozenset(kw.lower() for kw in keywords)
+            for category, keywords in self.category_keywords.items()
+        }
     
     def classify(self, features) -> Optional[Dict]:
         """基于语义分析的分类"""
         try:
-            url = features.url
             title = features.title
             domain = features.domain
             
@@ -92,8 +99,8 @@ class SemanticAnalyzer:
             # 2. 标题语义分析
             title_score = self._analyze_title_semantics(title)
             
-            # 3. URL路径语义分析
-            path_score = self._analyze_path_semantics(url)
+            # 3. URL路径语义分析（复用特征提取时已解析的路径段，不再重复 urlparse）
+            path_score = self._analyze_path_semantics('/'.join(features.path_segments))
             
             # 4. 综合语义评分
             combined_scores = self._combine_semantic_scores(
@@ -126,16 +133,16 @@ class SemanticAnalyzer:
         scores = {}
         
         # 检查域名模式
-        for pattern, category in self.domain_patterns.items():
-            if re.search(pattern, domain, re.IGNORECASE):
+        for pattern, category in self._compiled_domain_patterns:
+            if pattern.search(domain):
                 scores[category] = scores.get(category, 0) + 0.8
         
         # 检查域名中的关键词
         domain_words = re.findall(r'[a-zA-Z]+', domain.lower())
         for word in domain_words:
             if len(word) > 2 and word not in self.stopwords:
-                for category, keywords in self.category_keywords.items():
-                    if word in [kw.lower() for kw in keywords]:
+                for category, keywords in self._category_keyword_sets.items():
+                    if word in keywords:
                         scores[category] = scores.get(category, 0) + 0.3
         
         return scores
@@ -158,18 +165,17 @@ class SemanticAnalyzer:
         
         return scores
     
-    def _analyze_path_semantics(self, url: str) -> Dict[str, float]:
-        """分析URL路径语义"""
+    def _analyze_path_semantics(self, path: str) -> Dict[str, float]:
+        """分析URL路径语义（参数为已解析出的路径）"""
         scores = {}
         
         try:
-            parsed = urlparse(url)
-            path_words = re.findall(r'[a-zA-Z]+', parsed.path.lower())
+            path_words = re.findall(r'[a-zA-Z]+', path.lower())
             
             for word in path_words:
                 if len(word) > 2 and word not in self.stopwords:
-                    for category, keywords in self.category_keywords.items():
-                        if word in [kw.lower() for kw in keywords]:
+                    for category, keywords in self._category_keyword_sets.items():
+                        if word in keywords:
                             scores[category] = scores.get(category, 0) + 0.2
         
         except Exception:
@@ -234,12 +240,14 @@ class SemanticAnalyzer:
         return combined
 
 # user_profiler.py  
-import json
+import heapq
 import os
 from collections import defaultdict, Counter
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import math
+from .json_io import load_json, dump_json
 
 class UserProfiler:
     """用户画像分析器 - 基于用户行为的个性化分类"""
@@ -255,8 +263,7 @@ class UserProfiler:
         """加载用户偏好数据"""
         if os.path.exists(self.profile_file):
             try:
-                with open(self.profile_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json(self.profile_file)
             except Exception:
                 pass
         
@@ -548,8 +555,7 @@ class UserProfiler:
     def _save_preferences(self):
         """保存用户偏好"""
         try:
-            with open(self.profile_file, 'w', encoding='utf-8') as f:
-                json.dump(self.preferences, f, ensure_ascii=False, indent=2)
+            dump_json(self.preferences, self.profile_file)
         except Exception:
             pass
     
@@ -580,7 +586,7 @@ class UserProfiler:
             total = sum(category_prefs.values())
             insights['favorite_categories'] = {
                 k: round(v/total * 100, 1) for k, v in 
-                sorted(category_prefs.items(), key=lambda x: x[1], reverse=True)[:5]
+                heapq.nlargest(5, category_prefs.items(), key=itemgetter(1))
             }
         
         # 分析最常访问的域名
@@ -591,7 +597,7 @@ class UserProfiler:
                 domain_totals[domain] = sum(categories.values())
         
         if domain_totals:
-            insights['favorite_domains'] = dict(sorted(domain_totals.items(), key=lambda x: x[1], reverse=True)[:5])
+            insights['favorite_domains'] = dict(heapq.nlargest(5, domain_totals.items(), key=itemgetter(1)))
         
         # 分析活动模式
         time_patterns = self.preferences.get('time_patterns', {})
@@ -634,10 +640,15 @@ class PerformanceMonitor:
 # deduplicator.py
 import re
 import hashlib
+import math
+from bisect import bisect_right
 from urllib.parse import urlparse, parse_qs, urljoin
-from typing import List, Dict, Tuple, Set
+from typing import Callable, Iterable, List, Dict, Tuple, Set
 from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import defaultdict, Counter
+
+# 域名不同时 _calculate_url_similarity 的上限（domain 0 + path 0.3 + query 0.2）
+_CROSS_DOMAIN_URL_SIMILARITY = 0.5
 
 class BookmarkDeduplicator:
     """书签去重器 - 高级相似度检测和去重"""
@@ -669,6 +680,9 @@ class BookmarkDeduplicator:
         for i, bookmark in enumerate(bookmarks):
             bookmark['_original_index'] = i
         
+        # 只与可能达到阈值的候选书签比较（结果与两两全比较一致）
+        candidates_after = self._build_candidate_index(bookmarks)
+        
         # 逐一比较书签
         for i, bookmark1 in enumerate(bookmarks):
             if i in processed_indices:
@@ -678,10 +692,11 @@ class BookmarkDeduplicator:
             similar_group = [bookmark1]
             similar_indices = {i}
             
-            for j, bookmark2 in enumerate(bookmarks[i+1:], i+1):
+            for j in candidates_after(i):
                 if j in processed_indices:
                     continue
                 
+                bookmark2 = bookmarks[j]
                 if self._are_duplicates(bookmark1, bookmark2):
                     similar_group.append(bookmark2)
                     similar_indices.add(j)
@@ -706,6 +721,78 @@ class BookmarkDeduplicator:
         
         return unique_bookmarks, duplicates
     
+    def _build_candidate_index(self, bookmarks: List[Dict]) -> Callable[[int], Iterable[int]]:
+        """构建候选索引：返回 i -> 之后可能与书签 i 重复的下标（升序）
+        
+        域名不同时 URL 相似度至多 0.5，只有标题相似度可能让两条书签判为重复；
+        而标题相似度 = 0.6 * 序列相似度 + 0.4 * 词级 Jaccard，达到阈值要求 Jaccard 有下限。
+        因此候选只来自：同域名（原始 / 标准化 URL 各一份分桶）、标题词集合按前缀过滤后
+        有共同词、以及 URL 无法解析的书签。阈值过低无法剪枝时退回两两全比较。
+        """
+        n = len(bookmarks)
+        
+        def all_after(i: int) -> Iterable[int]:
+            return range(i + 1, n)
+        
+        if self.url_threshold <= _CROSS_DOMAIN_URL_SIMILARITY:
+            return all_after
+        # 跨域名判重所需的最低标题相似度，以及由此推出的最低词级 Jaccard
+        title_needed = min(
+            self.title_threshold,
+            (self.similarity_threshold - 0.4 * _CROSS_DOMAIN_URL_SIMILARITY) / 0.6
+        )
+        min_jaccard = (title_needed - 0.6) / 0.4 - 1e-9
+        if min_jaccard <= 0:
+            return all_after
+        
+        raw_keys: List[str] = []
+        norm_keys: List[str] = []
+        word_sets: List[Set[str]] = []
+        unparsable: List[int] = []
+        for i, bookmark in enumerate(bookmarks):
+            url = bookmark.get('url', '')
+            try:
+                raw_key = urlparse(url).netloc
+                norm_key = urlparse(self._normalize_url(url)).netloc
+            except Exception:
+                raw_key = norm_key = ''
+                unparsable.append(i)
+            raw_keys.append(raw_key)
+            norm_keys.append(norm_key)
+            word_sets.append(set(self._clean_title(bookmark.get('title', '')).split()))
+        
+        raw_buckets: Dict[str, List[int]] = defaultdict(list)
+        norm_buckets: Dict[str, List[int]] = defaultdict(list)
+        for i in range(n):
+            raw_buckets[raw_keys[i]].append(i)
+            norm_buckets[norm_keys[i]].append(i)
+        
+        # 前缀过滤：词按全局出现次数升序排列，Jaccard >= t 的两个集合必在各自前
+        # len - ceil(t * len) + 1 个词中有共同词
+        word_freq = Counter(word for words in word_sets for word in words)
+        prefixes: List[List[str]] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for i, words in enumerate(word_sets):
+            ordered = sorted(words, key=lambda word: (word_freq[word], word))
+            prefix = ordered[:len(ordered) - math.ceil(min_jaccard * len(ordered)) + 1] if ordered else []
+            prefixes.append(prefix)
+            for word in prefix:
+                postings[word].append(i)
+        
+        unparsable_set = set(unparsable)
+        
+        def candidates_after(i: int) -> Iterable[int]:
+            if i in unparsable_set:
+                return all_after(i)
+            lists = [raw_buckets[raw_keys[i]], norm_buckets[norm_keys[i]], unparsable]
+            lists.extend(postings[word] for word in prefixes[i])
+            candidates: Set[int] = set()
+            for indices in lists:
+                candidates.update(indices[bisect_right(indices, i):])
+            return sorted(candidates)
+        
+        return candidates_after
+    
     def _are_duplicates(self, bookmark1: Dict, bookmark2: Dict) -> bool:
         """判断两个书签是否重复"""
         # 尝试所有去重策略
@@ -1446,16 +1533,19 @@ class HealthChecker:
         }
 
 # data_exporter.py
-import json
 import csv
 import xml.etree.ElementTree as ET
 from typing import Optional, Dict
 from xml.dom import minidom
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 import os
 import re
 from .emoji_cleaner import clean_title as clean_emoji_title
+from .json_io import encode_json
+
+# 导出文件写缓冲大小
+EXPORT_BUFFER_SIZE = 1 << 16
 
 class DataExporter:
     """数据导出器 - 支持多种格式的书签导出"""
@@ -1466,59 +1556,66 @@ class DataExporter:
     
     def export_html(self, organized_bookmarks: Dict, output_file: str, stats: Optional[Dict] = None):
         """导出HTML格式 - 可导入浏览器"""
-        html_content = self._generate_html_content(organized_bookmarks, stats)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._write_lines(output_file, self._iter_html_lines(organized_bookmarks, stats))
+    
+    def _write_lines(self, output_file: str, lines: Iterator[str]):
+        """边生成边写入，不在内存中拼接完整文档"""
+        with open(output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            sep = ''
+            for line in lines:
+                f.write(sep + line)
+                sep = '\n'
     
     def _generate_html_content(self, organized_bookmarks: Dict, stats: Optional[Dict] = None) -> str:
         """生成符合浏览器收藏夹栏规范的HTML内容，用于完全覆盖"""
-        html_parts = []
-        
+        return '\n'.join(self._iter_html_lines(organized_bookmarks, stats))
+    
+    def _iter_html_lines(self, organized_bookmarks: Dict, stats: Optional[Dict] = None) -> Iterator[str]:
+        """逐行生成HTML内容"""
         # HTML标准头部
-        html_parts.append('<!DOCTYPE NETSCAPE-Bookmark-file-1>')
-        html_parts.append('<!-- This is an automatically generated file.')
-        html_parts.append('     It will be read and overwritten.')
-        html_parts.append('     DO NOT EDIT! -->')
-        html_parts.append('<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">')
-        html_parts.append('<TITLE>Bookmarks</TITLE>')
-        html_parts.append('<H1>Bookmarks</H1>')
+        yield '<!DOCTYPE NETSCAPE-Bookmark-file-1>'
+        yield '<!-- This is an automatically generated file.'
+        yield '     It will be read and overwritten.'
+        yield '     DO NOT EDIT! -->'
+        yield '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">'
+        yield '<TITLE>Bookmarks</TITLE>'
+        yield '<H1>Bookmarks</H1>'
 
         # 添加统计信息注释
         if stats:
-            html_parts.append('<!--')
-            html_parts.append(f'    Generator: AI智能书签分类系统 v2.0')
-            html_parts.append(f'    Export Time: {self.export_timestamp}')
-            html_parts.append(f'    Processed Bookmarks: {stats.get("processed_bookmarks", 0)} / {stats.get("total_bookmarks", 0)}')
+            yield '<!--'
+            yield f'    Generator: AI智能书签分类系统 v2.0'
+            yield f'    Export Time: {self.export_timestamp}'
+            yield f'    Processed Bookmarks: {stats.get("processed_bookmarks", 0)} / {stats.get("total_bookmarks", 0)}'
             
             classifier_stats = stats.get('classifier_stats', {})
             if classifier_stats:
                 methods = classifier_stats.get('classification_methods', {})
                 if methods:
-                    html_parts.append('    Classification Stats:')
-                    html_parts.append(f'      - Rule Engine: {methods.get("rule_engine", 0)}')
-                    html_parts.append(f'      - ML Classifier: {methods.get("ml_classifier", 0)}')
-                    html_parts.append(f'      - Unclassified: {methods.get("unclassified (fallback)", 0)}')
+                    yield '    Classification Stats:'
+                    yield f'      - Rule Engine: {methods.get("rule_engine", 0)}'
+                    yield f'      - ML Classifier: {methods.get("ml_classifier", 0)}'
+                    yield f'      - Unclassified: {methods.get("unclassified (fallback)", 0)}'
             if stats.get('llm_organizer_used'):
                 llm_stats = stats.get('llm_organizer_stats', {})
-                html_parts.append('    LLM Organizer: enabled')
+                yield '    LLM Organizer: enabled'
                 if llm_stats:
-                    html_parts.append(f'      - Calls: {llm_stats.get("calls", 0)} (cache_hits: {llm_stats.get("cache_hits", 0)})')
+                    yield f'      - Calls: {llm_stats.get("calls", 0)} (cache_hits: {llm_stats.get("cache_hits", 0)})'
                 llm_meta = stats.get('llm_organizer_meta')
                 if llm_meta:
                     model = llm_meta.get('llm_model', '')
-                    html_parts.append(f'      - Model: {model}')
+                    yield f'      - Model: {model}'
                     primary_order = llm_meta.get('primary_order') or []
                     if primary_order:
-                        html_parts.append(f'      - Primary Order: {", ".join(primary_order[:8])}')
-            html_parts.append('-->')
+                        yield f'      - Primary Order: {", ".join(primary_order[:8])}'
+            yield '-->'
 
-        html_parts.append('<DL><p>')
+        yield '<DL><p>'
 
         # 创建一个“收藏夹栏”文件夹
         # PERSONAL_TOOLBAR_FOLDER="true" 是关键属性
-        html_parts.append('    <DT><H3 PERSONAL_TOOLBAR_FOLDER="true">收藏夹栏</H3>')
-        html_parts.append('    <DL><p>')
+        yield '    <DT><H3 PERSONAL_TOOLBAR_FOLDER="true">收藏夹栏</H3>'
+        yield '    <DL><p>'
 
         # 直接在收藏夹栏内生成分类文件夹（跳过空分类/子分类）
         for category, category_data in organized_bookmarks.items():
@@ -1528,32 +1625,30 @@ class DataExporter:
             if not items and not has_sub_items:
                 continue
 
-            html_parts.append(f'        <DT><H3>{self._escape_html(category)}</H3>')
-            html_parts.append('        <DL><p>')
+            yield f'        <DT><H3>{self._escape_html(category)}</H3>'
+            yield '        <DL><p>'
 
             # 直接在分类下的书签
             for item in items:
-                html_parts.append(self._format_bookmark_html(item, indent='            '))
+                yield self._format_bookmark_html(item, indent='            ')
 
             # 子分类
             for subcat_name, subcat_data in subcategories.items():
                 sub_items = subcat_data.get('_items', [])
                 if not sub_items:
                     continue
-                html_parts.append(f'            <DT><H3>{self._escape_html(subcat_name)}</H3>')
-                html_parts.append('            <DL><p>')
+                yield f'            <DT><H3>{self._escape_html(subcat_name)}</H3>'
+                yield '            <DL><p>'
                 for item in sub_items:
-                    html_parts.append(self._format_bookmark_html(item, indent='                '))
-                html_parts.append('            </DL><p>')
+                    yield self._format_bookmark_html(item, indent='                ')
+                yield '            </DL><p>'
 
-            html_parts.append('        </DL><p>')
+            yield '        </DL><p>'
         
         # 闭合所有标签
-        html_parts.append('    </DL><p>') # 闭合收藏夹栏
-        html_parts.append('</DL><p>') # 闭合根
-        html_parts.append('</HTML>')
-        
-        return '\n'.join(html_parts)
+        yield '    </DL><p>' # 闭合收藏夹栏
+        yield '</DL><p>' # 闭合根
+        yield '</HTML>'
     
     def _format_bookmark_html(self, item: Dict, indent: str = '        ') -> str:
         """格式HTML书签项"""
@@ -1642,105 +1737,117 @@ class DataExporter:
             if llm_stats:
                 statistics['llm_organizer'] = llm_stats
 
-        data = {
-            'metadata': metadata,
-            'statistics': statistics,
-            'bookmarks': filtered
-        }
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # 逐分类编码并写入，峰值内存只与单个分类相关；
+        # 子文档缩进后拼接，格式与整体 indent=2 输出一致
+        with open(output_file, 'wb') as f:
+            f.write(b'{\n  "metadata": ' + self._indent_json(encode_json(metadata), 1))
+            f.write(b',\n  "statistics": ' + self._indent_json(encode_json(statistics), 1))
+            f.write(b',\n  "bookmarks": ')
+            if not filtered:
+                f.write(b'{}')
+            else:
+                sep = b'{'
+                for category, category_data in filtered.items():
+                    f.write(sep + b'\n    ' + encode_json(category) + b': '
+                            + self._indent_json(encode_json(category_data), 2))
+                    sep = b','
+                f.write(b'\n  }')
+            f.write(b'\n}')
+
+    @staticmethod
+    def _indent_json(payload: bytes, level: int) -> bytes:
+        """为缩进 2 的 JSON 片段整体增加缩进层级（JSON 字符串内不含原始换行）"""
+        return payload.replace(b'\n', b'\n' + b'  ' * level)
     
     def export_markdown(self, organized_bookmarks: Dict, output_file: str, stats: Optional[Dict] = None):
         """导出Markdown格式 - 可读性强"""
-        md_content = self._generate_markdown_content(organized_bookmarks, stats)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        self._write_lines(output_file, self._iter_markdown_lines(organized_bookmarks, stats))
     
     def _generate_markdown_content(self, organized_bookmarks: Dict, stats: Optional[Dict] = None) -> str:
         """生成Markdown内容"""
-        lines = []
-        
+        return '\n'.join(self._iter_markdown_lines(organized_bookmarks, stats))
+    
+    def _iter_markdown_lines(self, organized_bookmarks: Dict, stats: Optional[Dict] = None) -> Iterator[str]:
+        """逐行生成Markdown内容"""
         # 文档头部
-        lines.append('# AI智能书签分类报告')
-        lines.append('')
-        lines.append(f'> 生成时间: {self.export_timestamp}')
-        lines.append('')
+        yield '# AI智能书签分类报告'
+        yield ''
+        yield f'> 生成时间: {self.export_timestamp}'
+        yield ''
         
         # 统计信息
         if stats:
-            lines.append('## 📊 处理统计')
-            lines.append('')
-            lines.append(f"- **总书签数**: {stats.get('total_bookmarks', 0)}")
-            lines.append(f"- **已处理书签**: {stats.get('processed_bookmarks', 0)}")
-            lines.append(f"- **移除重复数**: {stats.get('duplicates_removed', 0)}")
-            lines.append(f"- **处理时间**: {stats.get('processing_time', 0):.2f} 秒")
-            lines.append(f"- **处理速度**: {stats.get('processing_speed_bps', 0):.2f} 书签/秒")
-            lines.append('')
+            yield '## 📊 处理统计'
+            yield ''
+            yield f"- **总书签数**: {stats.get('total_bookmarks', 0)}"
+            yield f"- **已处理书签**: {stats.get('processed_bookmarks', 0)}"
+            yield f"- **移除重复数**: {stats.get('duplicates_removed', 0)}"
+            yield f"- **处理时间**: {stats.get('processing_time', 0):.2f} 秒"
+            yield f"- **处理速度**: {stats.get('processing_speed_bps', 0):.2f} 书签/秒"
+            yield ''
 
             if stats.get('llm_organizer_used'):
-                lines.append(f"- **LLM 深度整理**: ✅ 已启用")
+                yield f"- **LLM 深度整理**: ✅ 已启用"
                 llm_meta = stats.get('llm_organizer_meta', {})
                 llm_stats = stats.get('llm_organizer_stats', {})
                 model = llm_meta.get('llm_model') if isinstance(llm_meta, dict) else None
                 if model:
-                    lines.append(f"  - 使用模型: {model}")
+                    yield f"  - 使用模型: {model}"
                 if llm_meta:
                     primary_order = llm_meta.get('primary_order') or []
                     if primary_order:
                         joined = ', '.join(primary_order[:8])
-                        lines.append(f"  - 主分类顺序: {joined}")
+                        yield f"  - 主分类顺序: {joined}"
                 if llm_stats:
-                    lines.append(f"  - 调用次数: {llm_stats.get('calls', 0)} (缓存命中 {llm_stats.get('cache_hits', 0)})")
-                lines.append('')
+                    yield f"  - 调用次数: {llm_stats.get('calls', 0)} (缓存命中 {llm_stats.get('cache_hits', 0)})"
+                yield ''
             else:
-                lines.append(f"- **LLM 深度整理**: ❌ 未启用或调用失败")
-                lines.append('')
+                yield f"- **LLM 深度整理**: ❌ 未启用或调用失败"
+                yield ''
 
             # 分类方法统计
             classifier_stats = stats.get('classifier_stats', {})
             if classifier_stats:
-                lines.append('### 🤖 分类方法统计')
+                yield '### 🤖 分类方法统计'
                 methods = classifier_stats.get('classification_methods', {})
                 if methods:
                     total = methods.get('total', 1)
-                    lines.append(f"- **规则引擎**: {methods.get('rule_engine', 0)} ({methods.get('rule_engine', 0) / total:.1%})")
-                    lines.append(f"- **机器学习**: {methods.get('ml_classifier', 0)} ({methods.get('ml_classifier', 0) / total:.1%})")
-                    lines.append(f"- **未分类**: {methods.get('unclassified (fallback)', 0)} ({methods.get('unclassified (fallback)', 0) / total:.1%})")
-                lines.append(f"- **平均置信度**: {classifier_stats.get('average_confidence', 0):.2f}")
-                lines.append('')
+                    yield f"- **规则引擎**: {methods.get('rule_engine', 0)} ({methods.get('rule_engine', 0) / total:.1%})"
+                    yield f"- **机器学习**: {methods.get('ml_classifier', 0)} ({methods.get('ml_classifier', 0) / total:.1%})"
+                    yield f"- **未分类**: {methods.get('unclassified (fallback)', 0)} ({methods.get('unclassified (fallback)', 0) / total:.1%})"
+                yield f"- **平均置信度**: {classifier_stats.get('average_confidence', 0):.2f}"
+                yield ''
 
             # 分类分布
             categories_found = stats.get('categories_found', {})
             if categories_found:
-                lines.append(f"### 📁 分类分布")
+                yield f"### 📁 分类分布"
                 for category, count in sorted(categories_found.items(), key=lambda x: x[1], reverse=True):
-                    lines.append(f"  - {category}: {count} 个")
+                    yield f"  - {category}: {count} 个"
             
-            lines.append('')
+            yield ''
         
         # 目录（仅非空分类）
-        lines.append('## 📚 目录')
-        lines.append('')
+        yield '## 📚 目录'
+        yield ''
         non_empty_categories = [c for c, d in organized_bookmarks.items() if self._category_has_items(d)]
         for i, category in enumerate(non_empty_categories, 1):
-            lines.append(f"{i}. [{category}](#{self._slugify(category)})")
-        lines.append('')
+            yield f"{i}. [{category}](#{self._slugify(category)})"
+        yield ''
         
         # 分类内容（仅非空分类/子分类）
         for category, category_data in organized_bookmarks.items():
             if not self._category_has_items(category_data):
                 continue
-            lines.append(f'## {category}')
-            lines.append('')
+            yield f'## {category}'
+            yield ''
             
             # 直接在分类下的书签
             items = category_data.get('_items', [])
             if items:
                 for item in items:
-                    lines.append(self._format_bookmark_markdown(item))
-                lines.append('')
+                    yield self._format_bookmark_markdown(item)
+                yield ''
             
             # 子分类
             subcategories = category_data.get('_subcategories', {})
@@ -1748,17 +1855,15 @@ class DataExporter:
                 sub_items = subcat_data.get('_items', [])
                 if not sub_items:
                     continue
-                lines.append(f'### {subcat_name}')
-                lines.append('')
+                yield f'### {subcat_name}'
+                yield ''
                 for item in sub_items:
-                    lines.append(self._format_bookmark_markdown(item))
-                lines.append('')
+                    yield self._format_bookmark_markdown(item)
+                yield ''
         
         # 页脚
-        lines.append('---')
-        lines.append(f'*由 AI智能书签分类系统 v2.0 生成 - {self.export_timestamp}*')
-        
-        return '\n'.join(lines)
+        yield '---'
+        yield f'*由 AI智能书签分类系统 v2.0 生成 - {self.export_timestamp}*'
     
     def _format_bookmark_markdown(self, item: Dict) -> str:
         """格式Markdown书签项"""
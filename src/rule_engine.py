@@ -9,6 +9,7 @@ import logging
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
 from collections import defaultdict
+from operator import itemgetter
 from urllib.parse import urlparse
 
 @dataclass
@@ -118,6 +119,8 @@ class RuleEngine:
                         'rule_id': rule_id,
                         'match_type': match_type,
                         'patterns': compiled_patterns,
+                        'any_pattern': self._combine_patterns(compiled_patterns),
+                        'literals': self._literal_keywords(keywords, compiled_patterns),
                         'exclusions': compiled_exclusions,
                         'weight': weight,
                         'original_keywords': keywords,
@@ -126,8 +129,41 @@ class RuleEngine:
 
                     self.compiled_rules[category].append(compiled_rule)
 
+        self._literal_gates = self._build_literal_gates()
         self.logger.info(f"预编译了 {sum(len(rules) for rules in self.compiled_rules.values())} 个规则")
     
+    def _build_literal_gates(self) -> Dict[str, re.Pattern]:
+        """按匹配字段合并全部纯文本规则的关键词，一次扫描判断该字段上是否可能有纯文本规则命中"""
+        literals_by_type: Dict[str, Set[str]] = defaultdict(set)
+        for rules in self.compiled_rules.values():
+            for rule in rules:
+                literals = rule.get('literals')
+                if literals:
+                    literals_by_type[rule['match_type']].update(literals)
+        return {
+            match_type: re.compile('|'.join(map(re.escape, literals)))
+            for match_type, literals in literals_by_type.items()
+        }
+    
+    @staticmethod
+    def _literal_keywords(keywords: List, compiled_patterns: List[re.Pattern]) -> Optional[tuple]:
+        """关键词均为纯文本（无通配符）时返回预先小写的关键词元组，否则返回 None"""
+        if len(compiled_patterns) != len(keywords):
+            return None
+        if not all(isinstance(kw, str) and '*' not in kw and '?' not in kw for kw in keywords):
+            return None
+        return tuple(kw.lower() for kw in keywords)
+    
+    @staticmethod
+    def _combine_patterns(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+        """将规则的全部关键词合并为单个交替正则，一次扫描判断是否有任一关键词命中"""
+        if not patterns:
+            return None
+        try:
+            return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns), re.IGNORECASE)
+        except re.error:
+            return None
+    
     def classify(self, features) -> Optional[Dict]:
         """基于规则进行分类"""
         try:
@@ -159,7 +195,7 @@ class RuleEngine:
             if total_score > 0:
                 alternatives = [(cat, score/total_score) for cat, score in category_scores.items() 
                               if cat != best_category]
-            alternatives.sort(key=lambda x: x[1], reverse=True)
+            alternatives.sort(key=itemgetter(1), reverse=True)
             
             self.stats['total_matches'] += 1
             self.stats['category_predictions'][best_category] += 1
@@ -180,8 +216,8 @@ class RuleEngine:
                     resource_type_hint = ct_map.get(features.content_type)
 
                 domain = getattr(features, 'domain', '').lower()
-                url_lower = getattr(features, 'url', '').lower()
-                title_lower = getattr(features, 'title', '').lower()
+                url_lower = getattr(features, 'url_lower', '') or getattr(features, 'url', '').lower()
+                title_lower = getattr(features, 'title_lower', '') or getattr(features, 'title', '').lower()
 
                 if any(d in domain for d in ['github.com', 'gitlab.com', 'bitbucket.org', 'gitee.com', 'sourceforge.net', 'github.io']):
                     resource_type_hint = 'code_repository'
@@ -199,6 +235,8 @@ class RuleEngine:
             return {
                 'category': best_category,
                 'confidence': confidence,
+                # 最佳分类命中规则的原始权重之和（confidence 为占比，单一分类命中时恒为 1.0）
+                'rule_score': category_scores[best_category],
                 'alternatives': alternatives[:3],
                 'reasoning': reasoning,
                 'method': 'rule_engine',
@@ -209,18 +247,28 @@ class RuleEngine:
             self.logger.error(f"规则分类失败: {e}")
             return None
     
+    def classify_many(self, features_list: List) -> List[Optional[Dict]]:
+        """批量规则分类，结果顺序与输入一致"""
+        return [self.classify(features) for features in features_list]
+    
     def _find_matches(self, features) -> List[RuleMatch]:
         """查找匹配的规则"""
         matches = []
         
-        # 准备匹配文本
+        # 准备匹配文本（优先复用特征提取时已计算的小写副本）
+        url_lower = getattr(features, 'url_lower', '') or features.url.lower()
         match_texts = {
-            'domain': features.domain,
-            'title': features.title.lower(),
-            'url': features.url.lower(),
+            'domain': features.domain.lower(),
+            'title': getattr(features, 'title_lower', '') or features.title.lower(),
+            'url': url_lower,
             'path': '/'.join(features.path_segments).lower(),
             'content_type': features.content_type,
-            'url_ends_with': features.url.lower(),
+            'url_ends_with': url_lower,
+        }
+        # 字段上没有任何纯文本关键词出现时，该字段的纯文本规则都不必逐条检查
+        closed_types = {
+            match_type for match_type, gate in self._literal_gates.items()
+            if not gate.search(match_texts.get(match_type, '') or '')
         }
         
         for category, rules in self.compiled_rules.items():
@@ -230,53 +278,78 @@ class RuleEngine:
                 
                 if not target_text:
                     continue
+                if match_type in closed_types and rule.get('literals') is not None:
+                    continue
                 
-                # 检查模式匹配
-                for pattern in rule['patterns']:
-                    match = pattern.search(target_text)
-                    if match:
-                        # 检查排除条件
-                        excluded = False
-                        for exclusion_pattern in rule['exclusions']:
-                            if exclusion_pattern.search(target_text):
-                                excluded = True
-                                break
-                        
-                        if not excluded:
-                            all_keywords_in = rule.get('match_all_keywords_in') or {}
-                            if all_keywords_in:
-                                passed = True
-                                for field_name, field_patterns in all_keywords_in.items():
-                                    field_text = match_texts.get(field_name, '')
-                                    if not field_text:
-                                        passed = False
-                                        break
-                                    field_ok = False
-                                    for fp in field_patterns:
-                                        try:
-                                            if fp.search(field_text):
-                                                field_ok = True
-                                                break
-                                        except Exception:
-                                            continue
-                                    if not field_ok:
-                                        passed = False
-                                        break
-                                if not passed:
-                                    continue
-                            rule_match = RuleMatch(
-                                rule_id=rule['rule_id'],
-                                category=category,
-                                confidence=rule['weight'],
-                                matched_text=match.group(),
-                                rule_type=match_type
-                            )
-                            matches.append(rule_match)
-                            self.stats['rule_hits'][rule['rule_id']] += 1
-                            break  # 每个规则只匹配一次
+                matched_text = self._first_keyword_hit(rule, target_text)
+                if matched_text is None:
+                    continue
+                
+                # 检查排除条件
+                if any(exclusion_pattern.search(target_text) for exclusion_pattern in rule['exclusions']):
+                    continue
+                
+                all_keywords_in = rule.get('match_all_keywords_in') or {}
+                if all_keywords_in:
+                    passed = True
+                    for field_name, field_patterns in all_keywords_in.items():
+                        field_text = match_texts.get(field_name, '')
+                        if not field_text:
+                            passed = False
+                            break
+                        field_ok = False
+                        for fp in field_patterns:
+                            try:
+                                if fp.search(field_text):
+                                    field_ok = True
+                                    break
+                            except Exception:
+                                continue
+                        if not field_ok:
+                            passed = False
+                            break
+                    if not passed:
+                        continue
+                
+                rule_match = RuleMatch(
+                    rule_id=rule['rule_id'],
+                    category=category,
+                    confidence=rule['weight'],
+                    matched_text=matched_text,
+                    rule_type=match_type
+                )
+                matches.append(rule_match)
+                self.stats['rule_hits'][rule['rule_id']] += 1
         
         return matches
     
+    @staticmethod
+    def _first_keyword_hit(rule: Dict, target_text: str) -> Optional[str]:
+        """按关键词顺序返回首个命中的匹配文本，未命中返回 None（每个规则只匹配一次）"""
+        literals = rule.get('literals')
+        if literals is not None:
+            # 纯文本关键词：预先小写，直接做子串/后缀判断
+            if rule['match_type'] == 'url_ends_with':
+                for keyword in literals:
+                    if target_text.endswith(keyword):
+                        return keyword
+            else:
+                for keyword in literals:
+                    if keyword in target_text:
+                        return keyword
+            return None
+        
+        # 合并正则预筛：任一关键词都未命中则跳过逐个关键词匹配
+        any_pattern = rule.get('any_pattern')
+        if any_pattern is not None and not any_pattern.search(target_text):
+            return None
+        
+        for pattern in rule['patterns']:
+            match = pattern.search(target_text)
+            if match:
+                return match.group()
+        return None
+    
     def _calculate_scores(self, matches: List[RuleMatch]) -> Dict[str, float]:
         """计算分类得分"""
         category_scores = defaultdict(float)
@@ -313,12 +386,15 @@ class RuleEngine:
                 'rule_id': rule_id,
                 'match_type': match_type,
                 'patterns': [pattern],
+                'any_pattern': pattern,
+                'literals': (keyword.lower(),),
                 'exclusions': [],
                 'weight': weight,
                 'original_keywords': [keyword]
             }
             
             self.compiled_rules[category].append(compiled_rule)
+            self._literal_gates = self._build_literal_gates()
             self.logger.info(f"添加动态规则: {category} - {match_type}:{keyword}")
             
         except re.error as e:
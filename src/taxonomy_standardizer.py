@@ -1,8 +1,23 @@
 import os
 import re
 import yaml
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
+# 词表规范化结果缓存条目数（分类名/资源类型取值很少，几乎全部命中）
+NORMALIZE_CACHE_SIZE = 1024
+
+# content_type -> resource_type 的回退映射
+CONTENT_TYPE_RESOURCE_TYPES = {
+    "code_repository": "code_repository",
+    "documentation": "documentation",
+    "video": "video",
+    "academic_paper": "paper",
+    "news": "news",
+    "online_tool": "tool",
+    "webpage": "webpage",
+}
+
 
 class TaxonomyStandardizer:
     def __init__(self, config: Dict):
@@ -11,6 +26,11 @@ class TaxonomyStandardizer:
         self._resource_types_map: Dict[str, str] = {}
         self._load_subjects()
         self._load_resource_types()
+        # 词表加载后不再变化：按输入文本缓存规范化结果，省去逐条书签的去前缀与 lower()
+        self.normalize_subject = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self.normalize_subject)
+        self.normalize_resource_type = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self.normalize_resource_type)
+        # 分类名取值同样很少：主/子分类拆分与规范化对每个分类名只计算一次
+        self.derive_from_category = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(self.derive_from_category)
 
     def _get_path(self, key: str, default_path: str) -> str:
         tax = self.config.get("taxonomy", {}) or {}
@@ -80,23 +100,12 @@ class TaxonomyStandardizer:
         if not category:
             return None, None
         cat = str(category).strip()
-        main = cat
-        sub = None
-        if "/" in cat:
-            parts = cat.split("/", 1)
-            main = parts[0].strip()
-            sub = parts[1].strip()
+        main, sep, sub = cat.partition("/")
+        if sep:
+            main = main.strip()
+            sub = sub.strip()
         subject = self.normalize_subject(main)
         resource_type = self.normalize_resource_type(sub) if sub else None
         if not resource_type and content_type:
-            ct_map = {
-                "code_repository": "code_repository",
-                "documentation": "documentation",
-                "video": "video",
-                "academic_paper": "paper",
-                "news": "news",
-                "online_tool": "tool",
-                "webpage": "webpage",
-            }
-            resource_type = ct_map.get(content_type)
+            resource_type = CONTENT_TYPE_RESOURCE_TYPES.get(content_type)
         return subject, resource_type
@@ -116,3 +116,32 @@ class TestLLMBookmarkOrganizer(unittest.TestCase):
             self.assertGreaterEqual(stats.get("cache_hits", 0), 1)
         finally:
             os.environ.pop("OPENAI_API_KEY", None)
+
+    @patch("src.llm_organizer.requests.post")
+    def test_bookmarks_without_confidence(self, mock_post):
+        os.environ["OPENAI_API_KEY"] = "fake-key"
+        organizer = LLMBookmarkOrganizer(config=self.base_config)
+
+        bookmarks = [
+            {"url": "https://docs.python.org", "title": "Python 文档", "category": "💻 编程/文档"},
+            {"url": "https://realpython.com", "title": "Real Python", "category": "💻 编程/文档", "confidence": 0.8},
+        ]
+        llm_output = {
+            "category_mapping": {"💻 编程/文档": {"primary": "💻 编程", "secondary": "文档"}},
+            "primary_order": ["💻 编程"],
+            "secondary_order": {"💻 编程": ["文档"]},
+        }
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "choices": [{"message": {"content": json.dumps(llm_output, ensure_ascii=False)}}]
+        }
+        mock_post.return_value = response
+
+        try:
+            result = organizer.organize(bookmarks, baseline={})
+            self.assertIsNotNone(result)
+            items = result["organized"]["💻 编程"]["_subcategories"]["文档"]["_items"]
+            self.assertEqual([b["url"] for b in items], ["https://realpython.com", "https://docs.python.org"])
+        finally:
+            os.environ.pop("OPENAI_API_KEY", None)
@@ -18,7 +18,7 @@ import json
 import tempfile
 import shutil
 from unittest.mock import Mock, patch, MagicMock
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import time
 import random
 from datetime import datetime
@@ -40,6 +40,11 @@ except Exception:
     EnhancedClassifier = None
     EnhancedBookmarkFeatures = None
 
+try:
+    from src.ai_classifier import AIBookmarkClassifier
+except Exception:
+    AIBookmarkClassifier = None
+
 try:
     from src.ml_classifier import MLBookmarkClassifier, BookmarkFeatureExtractor, ML_AVAILABLE
 except Exception:
@@ -82,6 +87,36 @@ except Exception:
     EnhancedBookmarkProcessor = None
     _HAS_ENHANCED_PROCESSOR = False
 
+try:
+    from src import bookmark_parser
+    from src.bookmark_parser import AnchorLink, parse_bookmark_links
+except Exception:
+    bookmark_parser = None
+    AnchorLink = None
+    parse_bookmark_links = None
+
+try:
+    from src.placeholder_modules import BookmarkDeduplicator
+except Exception:
+    BookmarkDeduplicator = None
+
+try:
+    from src import json_io
+    from src.placeholder_modules import DataExporter
+except Exception:
+    json_io = None
+    DataExporter = None
+
+try:
+    from src.classification_store import ClassificationStore, config_fingerprint
+    from src.bookmark_processor import BookmarkProcessor
+    _HAS_CLASSIFICATION_STORE = True
+except Exception:
+    ClassificationStore = None
+    config_fingerprint = None
+    BookmarkProcessor = None
+    _HAS_CLASSIFICATION_STORE = False
+
 class TestDataGenerator:
     """测试数据生成器"""
     
@@ -228,6 +263,413 @@ class TestEnhancedClassifier(unittest.TestCase):
         # 验证缓存提升了性能
         self.assertLess(second_time, first_time)
 
+@unittest.skipUnless(AIBookmarkClassifier is not None, "AIBookmarkClassifier 不可用")
+class TestAIBookmarkClassifier(unittest.TestCase):
+    """主分类器测试"""
+    
+    def setUp(self):
+        """测试初始化"""
+        self.test_config = TestDataGenerator.generate_config()
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(self.test_config, f)
+            self.config_file = f.name
+    
+    def tearDown(self):
+        """测试清理"""
+        os.unlink(self.config_file)
+    
+    def _make_classifier(self):
+        return AIBookmarkClassifier(self.config_file, enable_ml=False, config=self.test_config)
+    
+    def test_classify_batch_matches_single(self):
+        """测试批量分类与逐条分类结果一致"""
+        items = [
+            ("https://github.com/user/repo", "Test Repository"),
+            ("https://youtube.com/watch?v=1", "Some Video"),
+            ("https://example.com/page", "Plain Page"),
+            ("https://github.com/user/repo", "Test Repository"),  # 批内重复
+        ]
+        
+        batch_results = self._make_classifier().classify_batch(items)
+        single = self._make_classifier()
+        single_results = [single.classify(url, title) for url, title in items]
+        
+        self.assertEqual(len(batch_results), len(items))
+        for batch_result, single_result in zip(batch_results, single_results):
+            self.assertEqual(batch_result.category, single_result.category)
+            self.assertAlmostEqual(batch_result.confidence, single_result.confidence)
+        self.assertIs(batch_results[0], batch_results[3])
+    
+    def _make_classifier_with(self, **ai_settings):
+        config = dict(self.test_config)
+        config['ai_settings'] = dict(ai_settings)
+        classifier = AIBookmarkClassifier(self.config_file, enable_ml=False, config=config)
+        classifier._semantic_analyzer = Mock()
+        classifier._semantic_analyzer.classify.return_value = None
+        return classifier
+    
+    def test_early_exit_disabled_by_default(self):
+        """测试未配置 early_exit_rule_score 时始终走完整融合"""
+        classifier = self._make_classifier_with()
+        result = classifier.classify("https://github.com/user/repo", "Test Repository")
+        
+        self.assertEqual(result.category, "技术栈")
+        classifier._semantic_analyzer.classify.assert_called_once()
+    
+    def test_early_exit_on_raw_rule_score(self):
+        """测试按命中规则的原始得分提前返回，单条与批量一致"""
+        items = [("https://github.com/user/repo", "Test Repository")]
+        
+        weak = self._make_classifier_with(early_exit_rule_score=20)
+        weak.classify(*items[0])
+        weak._semantic_analyzer.classify.assert_called_once()
+        
+        strong = self._make_classifier_with(early_exit_rule_score=10)
+        result = strong.classify(*items[0])
+        strong._semantic_analyzer.classify.assert_not_called()
+        self.assertEqual(result.category, "技术栈")
+        self.assertEqual(result.method, "rule_engine")
+        
+        batch = self._make_classifier_with(early_exit_rule_score=10)
+        batch_result = batch.classify_batch(items)[0]
+        batch._semantic_analyzer.classify.assert_not_called()
+        self.assertEqual(batch_result.category, result.category)
+        self.assertAlmostEqual(batch_result.confidence, result.confidence)
+    
+    def test_early_exit_applies_confidence_threshold(self):
+        """测试提前返回的结果同样受 confidence_threshold 约束"""
+        self.test_config['category_rules']['娱乐']['rules'].append(
+            {"match": "title", "keywords": ["video"], "weight": 5}
+        )
+        classifier = self._make_classifier_with(early_exit_rule_score=10, confidence_threshold=0.7)
+        result = classifier.classify("https://github.com/user/repo", "Repo video")
+        
+        classifier._semantic_analyzer.classify.assert_not_called()
+        self.assertEqual(result.category, "未分类")
+        self.assertAlmostEqual(result.confidence, 10 / 15)
+    
+    def test_force_all_methods_disables_early_exit(self):
+        """测试 force_all_methods 时结果与未启用提前返回一致"""
+        items = [
+            ("https://github.com/user/repo", "Test Repository"),
+            ("https://youtube.com/watch?v=1", "Some Video"),
+        ]
+        forced = self._make_classifier_with(early_exit_rule_score=1, force_all_methods=True)
+        baseline = self._make_classifier_with()
+        
+        for url, title in items:
+            forced_result = forced.classify(url, title)
+            baseline_result = baseline.classify(url, title)
+            self.assertEqual(forced_result.category, baseline_result.category)
+            self.assertAlmostEqual(forced_result.confidence, baseline_result.confidence)
+            self.assertEqual(forced_result.method, baseline_result.method)
+        self.assertEqual(forced._semantic_analyzer.classify.call_count, len(items))
+
+@unittest.skipUnless(_HAS_CLASSIFICATION_STORE, "ClassificationStore 不可用")
+class TestClassificationStore(unittest.TestCase):
+    """分类结果持久化缓存测试"""
+    
+    def setUp(self):
+        """测试初始化"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "cache", "classify.db")
+        self.data = {'category': '技术栈', 'subcategory': None, 'confidence': 0.9, 'method': 'rule_engine'}
+    
+    def tearDown(self):
+        """测试清理"""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_put_flush_get_clear(self):
+        """测试写入在 flush 后可读，clear 只清理当前指纹"""
+        store = ClassificationStore(self.db_path, "fp-a")
+        other = ClassificationStore(self.db_path, "fp-b")
+        try:
+            store.put("https://github.com/a", "A", self.data)
+            self.assertIsNone(store.get("https://github.com/a", "A"))
+            store.flush()
+            self.assertEqual(store.get("https://github.com/a", "A"), self.data)
+            self.assertIsNone(store.get("https://github.com/a", "other title"))
+            
+            # 不同指纹互相隔离
+            self.assertIsNone(other.get("https://github.com/a", "A"))
+            other.put("https://github.com/a", "A", dict(self.data, category='娱乐'))
+            other.flush()
+            self.assertEqual(other.get("https://github.com/a", "A")['category'], '娱乐')
+            self.assertEqual(store.get("https://github.com/a", "A")['category'], '技术栈')
+            
+            store.clear()
+            self.assertIsNone(store.get("https://github.com/a", "A"))
+            self.assertEqual(other.get("https://github.com/a", "A")['category'], '娱乐')
+        finally:
+            store.close()
+            other.close()
+    
+    def test_close_flushes_pending(self):
+        """测试关闭时写入剩余结果，重新打开后可读"""
+        store = ClassificationStore(self.db_path, "fp-a")
+        store.put("https://github.com/a", "A", self.data)
+        store.close()
+        
+        reopened = ClassificationStore(self.db_path, "fp-a")
+        try:
+            self.assertEqual(reopened.get("https://github.com/a", "A"), self.data)
+        finally:
+            reopened.close()
+    
+    def test_fingerprint_tracks_dependency_files(self):
+        """测试依赖文件（模型、词表）变化后指纹随之变化"""
+        config = TestDataGenerator.generate_config()
+        model_dir = os.path.join(self.temp_dir, "models")
+        os.makedirs(model_dir)
+        model_file = os.path.join(model_dir, "rf_model.pkl")
+        with open(model_file, 'wb') as f:
+            f.write(b"v1")
+        
+        files = [model_dir, os.path.join(self.temp_dir, "missing.yaml")]
+        before = config_fingerprint(config, True, files)
+        self.assertEqual(before, config_fingerprint(config, True, files))
+        self.assertNotEqual(before, config_fingerprint(config, False, files))
+        
+        with open(model_file, 'wb') as f:
+            f.write(b"retrained")
+        self.assertNotEqual(before, config_fingerprint(config, True, files))
+    
+    def test_processor_second_run_hits_store(self):
+        """测试 BookmarkProcessor 第二次运行直接命中持久化缓存"""
+        config = TestDataGenerator.generate_config()
+        config['ai_settings'] = {'persistent_cache_path': self.db_path}
+        config_file = os.path.join(self.temp_dir, "config.json")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        keys = [("https://github.com/user/repo", "Test Repository"), ("https://youtube.com/watch?v=1", "Some Video")]
+        
+        with BookmarkProcessor(config_file, use_ml=False) as first:
+            first_results = first._classify_keys(keys)
+        
+        with BookmarkProcessor(config_file, use_ml=False) as second:
+            second._classifier = Mock()
+            second_results = second._classify_keys(keys)
+            second._classifier.classify_batch.assert_not_called()
+        
+        # 持久化经 JSON 往返，元组会变成列表
+        self.assertEqual(second_results, json.loads(json.dumps(first_results)))
+
+@unittest.skipUnless(bookmark_parser is not None, "bookmark_parser 不可用")
+class TestBookmarkParser(unittest.TestCase):
+    """书签文件流式解析测试（lxml 与标准库回退两条路径）"""
+    
+    HEADER = '<!DOCTYPE NETSCAPE-Bookmark-file-1>\n<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">\n<DL><p>\n'
+    
+    def setUp(self):
+        """测试初始化"""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """测试清理"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _write(self, content: str) -> str:
+        path = os.path.join(self.temp_dir, "bookmarks.html")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+    
+    def _parse_both(self, path: str, **kwargs) -> List[List[Any]]:
+        """分别用 lxml 和标准库 html.parser 解析，返回两份结果"""
+        results = []
+        if bookmark_parser.etree is not None:
+            results.append(parse_bookmark_links(path, **kwargs))
+        with patch.object(bookmark_parser, 'etree', None):
+            results.append(parse_bookmark_links(path, **kwargs))
+        return results
+    
+    def test_basic_attributes(self):
+        """测试提取 href、文本和时间属性"""
+        path = self._write(self.HEADER + (
+            '<DT><A HREF="https://github.com/" ADD_DATE="1700000000" LAST_MODIFIED="1700000001">GitHub</A>\n'
+            '<DT><H3>文件夹</H3>\n'
+            '<DT><A NAME="anchor">无链接</A>\n'
+            '</DL><p>\n'
+        ))
+        for links in self._parse_both(path):
+            self.assertEqual(links, [AnchorLink('https://github.com/', 'GitHub', '1700000000', '1700000001')])
+    
+    def test_anchor_spanning_chunk_boundary(self):
+        """测试跨越 CHUNK_SIZE 分块边界的链接完整解析"""
+        anchor = '<DT><A HREF="https://example.com/boundary" ADD_DATE="1">跨块标题 boundary title</A>\n'
+        prefix = self.HEADER + '<DT><A HREF="https://example.com/first">first</A>\n'
+        # 填充到链接正好从分块边界前 20 字节处开始，使标签和文本被切开
+        padding = bookmark_parser.CHUNK_SIZE - len(prefix.encode('utf-8')) - 20
+        content = prefix + ' ' * padding + anchor + '<DT><A HREF="https://example.com/last">last</A>\n</DL><p>\n'
+        start = len((prefix + ' ' * padding).encode('utf-8'))
+        self.assertLess(start, bookmark_parser.CHUNK_SIZE)
+        self.assertGreater(start + len(anchor.encode('utf-8')), bookmark_parser.CHUNK_SIZE)
+        
+        path = self._write(content)
+        for links in self._parse_both(path):
+            self.assertEqual([link.href for link in links], [
+                'https://example.com/first', 'https://example.com/boundary', 'https://example.com/last'])
+            self.assertEqual(links[1].text, '跨块标题 boundary title')
+            self.assertEqual(links[1].add_date, '1')
+    
+    def test_href_prefixes_filter(self):
+        """测试 href_prefixes 只保留指定前缀的链接（忽略前导空白）"""
+        path = self._write(self.HEADER + (
+            '<DT><A HREF="https://a.com/">A</A>\n'
+            '<DT><A HREF="  http://b.com/">B</A>\n'
+            '<DT><A HREF="javascript:void(0)">JS</A>\n'
+            '<DT><A HREF="place:sort=8">Places</A>\n'
+            '</DL><p>\n'
+        ))
+        for links in self._parse_both(path, href_prefixes=('http://', 'https://')):
+            self.assertEqual([link.text for link in links], ['A', 'B'])
+        for links in self._parse_both(path):
+            self.assertEqual(len(links), 4)
+    
+    def test_entity_decoding(self):
+        """测试 href 和标题中的 HTML 实体被解码"""
+        path = self._write(self.HEADER + (
+            '<DT><A HREF="https://a.com/?x=1&amp;y=2">Tom &amp; Jerry &lt;3&gt; &#x4E2D;&#25991;</A>\n'
+            '</DL><p>\n'
+        ))
+        for links in self._parse_both(path):
+            self.assertEqual(links, [AnchorLink('https://a.com/?x=1&y=2', 'Tom & Jerry <3> 中文')])
+    
+    def test_empty_file(self):
+        """测试空文件返回空列表"""
+        path = self._write('')
+        for links in self._parse_both(path):
+            self.assertEqual(links, [])
+
+@unittest.skipUnless(BookmarkDeduplicator is not None, "BookmarkDeduplicator 不可用")
+class TestBookmarkDeduplicator(unittest.TestCase):
+    """书签去重测试"""
+    
+    @staticmethod
+    def _mixed_bookmarks(seed: int, count: int = 120) -> List[Dict[str, Any]]:
+        """生成同域名与跨域名混合、含近似标题和跟踪参数的书签"""
+        rng = random.Random(seed)
+        words = "python rust guide docs tutorial 教程 文档 api reference learn the a of 入门 指南 home".split()
+        domains = ["github.com", "GitHub.com", "www.example.com", "example.com",
+                   "docs.python.org", "blog.x.io", "zh.wikipedia.org", "[::1]", "http://[bad"]
+        bookmarks = []
+        for i in range(count):
+            domain = rng.choice(domains)
+            path = "/".join(rng.choice(words) for _ in range(rng.randint(0, 3)))
+            query = rng.choice(["", "?utm_source=x", "?a=1", "?ref=y&b=2"])
+            title = " ".join(rng.choice(words) for _ in range(rng.randint(0, 5)))
+            scheme = "" if domain.startswith("http") else rng.choice(["http://", "https://"])
+            bookmarks.append({
+                'url': scheme + domain + "/" + path + query,
+                'title': title + rng.choice(["", "", " - Site", " | Blog"]),
+                'add_date': str(rng.randint(1, 9)),
+            })
+        return bookmarks
+    
+    def test_candidate_pruning_matches_pairwise(self):
+        """测试候选索引剪枝后的去重结果与两两全比较一致"""
+        # 默认阈值下候选索引确实发生了剪枝
+        data = self._mixed_bookmarks(0)
+        candidates_after = BookmarkDeduplicator()._build_candidate_index(data)
+        self.assertLess(sum(len(list(candidates_after(i))) for i in range(len(data))),
+                        len(data) * (len(data) - 1) // 2)
+        
+        # 0.5 时无法剪枝，退回两两全比较
+        settings = [(0.85, 0.8), (0.85, 0.9), (0.7, 0.8), (0.5, 0.8)]
+        for seed in range(2):
+            data = self._mixed_bookmarks(seed)
+            for similarity_threshold, title_threshold in settings:
+                with self.subTest(seed=seed, similarity=similarity_threshold, title=title_threshold):
+                    pruned = BookmarkDeduplicator(similarity_threshold)
+                    pruned.title_threshold = title_threshold
+                    pairwise = BookmarkDeduplicator(similarity_threshold)
+                    pairwise.title_threshold = title_threshold
+                    
+                    expected_input = [dict(bookmark) for bookmark in data]
+                    with patch.object(pairwise, '_build_candidate_index',
+                                      return_value=lambda i: range(i + 1, len(expected_input))):
+                        expected = pairwise.remove_duplicates(expected_input)
+                    result = pruned.remove_duplicates([dict(bookmark) for bookmark in data])
+                    
+                    self.assertEqual(result, expected)
+                    self.assertTrue(expected[1], "夹具应包含重复书签")
+    
+    def test_empty_input(self):
+        """测试空列表"""
+        self.assertEqual(BookmarkDeduplicator().remove_duplicates([]), ([], []))
+
+@unittest.skipUnless(DataExporter is not None, "DataExporter 不可用")
+class TestDataExporter(unittest.TestCase):
+    """数据导出测试"""
+    
+    def setUp(self):
+        """测试初始化"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_file = os.path.join(self.temp_dir, "bookmarks.json")
+        self.exporter = DataExporter()
+        item = {'title': 'Tom & "Jerry" 教程', 'url': 'https://github.com/a?x=1&y=2', 'confidence': 0.85, 'tags': []}
+        self.organized = {
+            '技术栈': {'_items': [item], '_subcategories': {
+                '代码仓库': {'_items': [dict(item, title='多行\n标题')]},
+                '空子分类': {'_items': []},
+            }},
+            '娱乐': {'_items': [], '_subcategories': {'视频': {'_items': [dict(item, url='https://youtube.com/')]}}},
+            '空分类': {'_items': [], '_subcategories': {}},
+        }
+        self.stats = {'total_bookmarks': 3, 'processing_time': 1.25, 'category_distribution': {'技术栈': 2},
+                      'llm_organizer_meta': {'model': 'test'}, 'llm_organizer_stats': {'calls': 1}}
+    
+    def tearDown(self):
+        """测试清理"""
+        shutil.rmtree(self.temp_dir)
+    
+    def _expected_json(self, organized: Dict, stats: Dict) -> str:
+        """按整体 json.dump(..., indent=2) 生成预期输出"""
+        filtered = self.exporter._prune_empty(organized)
+        metadata = {
+            'export_time': self.exporter.export_timestamp,
+            'format_version': '2.0',
+            'generator': 'AI智能书签分类系统',
+            'total_categories': len(filtered),
+            'total_bookmarks': self.exporter._count_total_bookmarks(filtered),
+        }
+        statistics = dict(stats)
+        if stats.get('llm_organizer_meta'):
+            metadata['llm_organizer'] = stats['llm_organizer_meta']
+        if stats.get('llm_organizer_stats'):
+            statistics['llm_organizer'] = stats['llm_organizer_stats']
+        data = {'metadata': metadata, 'statistics': statistics, 'bookmarks': filtered}
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    
+    def _export(self, organized: Dict, stats: Optional[Dict]) -> str:
+        self.exporter.export_json(organized, self.output_file, stats)
+        with open(self.output_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def test_export_json_matches_indented_dump(self):
+        """测试逐分类写出的 JSON 与整体 indent=2 输出一致（orjson 与标准库两条路径）"""
+        expected = self._expected_json(self.organized, self.stats)
+        backends = [json_io.orjson, None] if json_io.orjson is not None else [None]
+        for backend in backends:
+            with self.subTest(orjson=backend is not None), patch.object(json_io, 'orjson', backend):
+                content = self._export(self.organized, self.stats)
+                with open(self.output_file, 'r', encoding='utf-8') as f:
+                    self.assertEqual(json.load(f), json.loads(expected))
+                self.assertEqual(content, expected)
+                self.assertNotIn('空分类', json.loads(content)['bookmarks'])
+    
+    def test_export_json_empty(self):
+        """测试所有分类为空时输出空的 bookmarks"""
+        organized = {'空分类': {'_items': [], '_subcategories': {}}}
+        for stats in (None, {}):
+            with self.subTest(stats=stats):
+                content = self._export(organized, stats)
+                data = json.loads(content)
+                self.assertEqual(data['bookmarks'], {})
+                self.assertEqual(data['statistics'], {})
+                self.assertEqual(data['metadata']['total_categories'], 0)
+                self.assertEqual(content, self._expected_json(organized, {}))
+
 @unittest.skipUnless(ML_AVAILABLE, "机器学习依赖不可用")
 class TestMLClassifier(unittest.TestCase):
     """机器学习分类器测试"""
@@ -592,6 +1034,11 @@ def run_tests():
     # 创建测试套件
     test_classes = [
         TestEnhancedClassifier,
+        TestAIBookmarkClassifier,
+        TestClassificationStore,
+        TestBookmarkParser,
+        TestBookmarkDeduplicator,
+        TestDataExporter,
         TestMLClassifier,
         TestPerformanceOptimizer,
         TestConfigManager,